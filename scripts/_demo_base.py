@@ -0,0 +1,364 @@
+"""
+Shared scaffolding for the Playwright demo recorders.
+
+DemoRecorderBase records one page in its own browser context:
+- a drawn cursor, injected into every document and animated by the page
+- cursor positions sampled in the page and drained into events.jsonl
+- click/scroll events streamed to events.jsonl as they happen
+
+Demo scripts subclass it and only write their scenario.
+"""
+
+import asyncio
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import async_playwright
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Records are only queued on the event loop; a listener thread formats and writes
+# them, so console I/O never stalls an animation. It runs for as long as the
+# handler is installed, and is stopped (flushing what's queued) at exit.
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def encode_record(record: dict) -> bytes:
+    """Serialize one events.jsonl record, newline included."""
+    if HAS_ORJSON:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode()
+
+
+# Demos share one Chromium, launched on first use. Attaching to a long-lived
+# Chrome over CDP is opt-in: set DEMO_CDP_PORT to the port it was started with
+# (--remote-debugging-port).
+_cdp_port_env = os.environ.get("DEMO_CDP_PORT")
+CDP_PORT: Optional[int] = int(_cdp_port_env) if _cdp_port_env else None
+_playwright = None
+_browser = None
+
+
+async def get_browser(args: Optional[List[str]] = None):
+    """Return the shared browser, launching or attaching to it on first use."""
+    global _playwright, _browser
+    if _browser is not None and _browser.is_connected():
+        return _browser
+    if _playwright is None:
+        _playwright = await async_playwright().start()
+    if CDP_PORT is not None:
+        try:
+            _browser = await _playwright.chromium.connect_over_cdp(
+                f"http://localhost:{CDP_PORT}", timeout=2000
+            )
+            logger.info(f"Attached to running browser on port {CDP_PORT}")
+            return _browser
+        except PlaywrightError:
+            logger.warning(f"No browser on port {CDP_PORT}; launching one")
+    _browser = await _playwright.chromium.launch(headless=False, args=args or [])
+    return _browser
+
+
+async def close_browser():
+    """Close the shared browser (or detach from an attached one) and stop Playwright."""
+    global _playwright, _browser
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+
+# Normal arrow cursor
+CURSOR_SVG = (
+    '<svg width="20" height="20" viewBox="0 0 20 20">'
+    '<path d="M4 2L4 17L8.5 12.5H12.5L4 2Z" fill="black" stroke="white" stroke-width="1.2"/>'
+    '</svg>'
+)
+CURSOR_STYLE = (
+    "position:fixed;pointer-events:none;z-index:2147483647;"
+    "filter:drop-shadow(1px 1px 1px rgba(0,0,0,0.3));"
+)
+
+
+def cursor_init_js(svg: str, style: str) -> str:
+    """Init script that builds the cursor once per document.
+
+    The observer re-attaches this same node if the page (or an SPA navigation)
+    drops it, so its SVG is only ever parsed once.
+    """
+    return """
+    (() => {
+        const cursor = document.createElement('div');
+        cursor.id = 'demo-cursor';
+        cursor.innerHTML = %s;
+        cursor.style.cssText = %s;
+        if (document.body) document.body.appendChild(cursor);
+        new MutationObserver(() => {
+            if (!cursor.isConnected && document.body) document.body.appendChild(cursor);
+        }).observe(document, {childList: true, subtree: true});
+        window.updateCursor = (x, y) => {
+            cursor.style.left = x + 'px';
+            cursor.style.top = y + 'px';
+            window.__recordMouse && window.__recordMouse(x, y);
+        };
+    })();
+""" % (json.dumps(svg), json.dumps(style))
+
+
+# Cursor positions are sampled in the page into a Float32Array ring of (t, x, y),
+# stamped on the page's monotonic clock and drained in one call. t is seconds
+# since window.__mouseOrigin (epoch ms), which is set when recording starts.
+MOUSE_SAMPLER_JS = """
+    (() => {
+        const MOUSE_SAMPLES = 36000;
+        const mousePath = new Float32Array(3 * MOUSE_SAMPLES);
+        let mouseCount = 0;
+        window.__recordMouse = (x, y) => {
+            if (window.__mouseOrigin === undefined) return;
+            const i = (mouseCount++ % MOUSE_SAMPLES) * 3;
+            const now = performance.timeOrigin + performance.now();
+            mousePath[i] = (now - window.__mouseOrigin) / 1000;
+            mousePath[i + 1] = x;
+            mousePath[i + 2] = y;
+        };
+        window.__drainMousePath = () => {
+            const n = Math.min(mouseCount, MOUSE_SAMPLES);
+            const out = new Array(3 * n);
+            for (let k = 0, j = mouseCount - n; k < n; k++, j++) {
+                const i = (j % MOUSE_SAMPLES) * 3;
+                out[3 * k] = mousePath[i];
+                out[3 * k + 1] = mousePath[i + 1];
+                out[3 * k + 2] = mousePath[i + 2];
+            }
+            mouseCount = 0;
+            return out;
+        };
+    })();
+"""
+
+# Plays a precomputed path on animation frames and resolves after the last point
+PLAY_CURSOR_JS = """([xs, ys, fps]) => new Promise(resolve => {
+    const t0 = performance.now();
+    const frame = (now) => {
+        const i = Math.min(xs.length - 1, Math.floor((now - t0) * fps / 1000));
+        window.updateCursor && window.updateCursor(xs[i], ys[i]);
+        if (i < xs.length - 1) requestAnimationFrame(frame); else resolve();
+    };
+    frame(t0);
+})"""
+
+# Starts sampling in the current document and records where the cursor rests
+START_MOUSE_TRACKING_JS = """([origin, x, y]) => {
+    window.__mouseOrigin = origin;
+    window.__recordMouse && window.__recordMouse(x, y);
+}"""
+
+# Smoothstep scroll run on the page's animation frames; resolves when it lands
+SCROLL_TO_JS = """([target, durationMs]) => new Promise(resolve => {
+    const start = window.scrollY, distance = target - start, t0 = performance.now();
+    const frame = (now) => {
+        const p = Math.min(1, (now - t0) / durationMs);
+        window.scrollTo(0, start + distance * p * p * (3 - 2 * p));
+        if (p < 1) requestAnimationFrame(frame); else resolve();
+    };
+    requestAnimationFrame(frame);
+})"""
+
+# Viewport boxes for {name: selector}, null where the element is missing or hidden
+ELEMENT_BOXES_JS = """(selectors) => Object.fromEntries(
+    Object.entries(selectors).map(([name, selector]) => {
+        const el = document.querySelector(selector);
+        const r = el && el.getBoundingClientRect();
+        return [name, r && (r.width || r.height)
+            ? {x: r.x, y: r.y, width: r.width, height: r.height}
+            : null];
+    })
+)"""
+
+
+class DemoRecorderBase:
+    """Records one page with a drawn cursor and an events.jsonl log.
+
+    Subclasses can override cursor_svg/cursor_style for a different cursor.
+    """
+
+    cursor_svg = CURSOR_SVG
+    cursor_style = CURSOR_STYLE
+
+    def __init__(self, url: str, output_dir: str = "./recordings", name: str = "demo"):
+        self.url = url
+        self.name = name
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(exist_ok=True)
+        self.viewport = {"width": 1280, "height": 800}
+        self.mouse_x = self.viewport["width"] // 2
+        self.mouse_y = self.viewport["height"] // 2
+
+        self.browser = None
+        self.context = None
+        self.page = None
+        self.video_dir = None
+
+        # Events stream to events.jsonl for post-processing
+        self.events_file = None
+        self._event_log = None
+        self.recording_start_time = 0
+        self.click_count = 0
+
+        # Cursor path sampled in the page for smooth zoom effects
+        self.mouse_samples = 0
+
+    async def setup(self, browser=None):
+        """Initialize browser, or record in a context of the one given."""
+        logger.info("Initializing browser...")
+        self.browser = browser or await get_browser()
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.video_dir = self.output_dir / f"{self.name}_{timestamp}"
+
+        self.context = await self.browser.new_context(
+            viewport=self.viewport,
+            record_video_dir=str(self.video_dir),
+            # Full viewport size; if unset Playwright scales it down to fit 800x800
+            record_video_size=self.viewport,
+        )
+        self.page = await self.context.new_page()
+        await self._inject_cursor()
+        logger.info(f"Recording to: {self.video_dir}")
+
+    async def _inject_cursor(self):
+        await self.page.add_init_script(MOUSE_SAMPLER_JS)
+        await self.page.add_init_script(cursor_init_js(self.cursor_svg, self.cursor_style))
+
+    async def start_recording(self):
+        """Start the clock, the event log and in-page mouse tracking."""
+        self.recording_start_time = time.time()
+        self._open_event_log()
+        await self._start_mouse_tracking()
+        self.log_event("start", 0, 0, "recording_start")
+
+    async def stop_recording(self):
+        """Log the end event and close out the event log with the last samples."""
+        self.log_event("end", 0, 0, "recording_end")
+        await self._drain_mouse_path()
+        self._event_log.close()
+        logger.info(f"Stopped mouse tracking - {self.mouse_samples} positions recorded")
+
+    async def close(self) -> Optional[str]:
+        """Close this demo's context and return the saved video path."""
+        video_path = await self.page.video.path() if self.page else None
+        # The browser is shared and closed by the script's main()
+        await self.context.close()
+        return video_path
+
+    async def _start_mouse_tracking(self):
+        origin = self.recording_start_time * 1000
+        # Documents loaded later (e.g. after a click navigates) keep sampling
+        await self.page.add_init_script(f"window.__mouseOrigin = {origin};")
+        await self.page.evaluate(START_MOUSE_TRACKING_JS, [origin, self.mouse_x, self.mouse_y])
+        logger.info("Started in-page mouse tracking")
+
+    async def _drain_mouse_path(self):
+        """Append the page's buffered cursor samples to the event log."""
+        raw = await self.page.evaluate(
+            "() => window.__drainMousePath ? window.__drainMousePath() : []"
+        )
+        if raw:
+            self._write_record({
+                "type": "mouse_path",
+                "data": [
+                    [round(t, 3), int(x), int(y)]
+                    for t, x, y in zip(raw[0::3], raw[1::3], raw[2::3])
+                ],
+            })
+            self.mouse_samples += len(raw) // 3
+
+    def _open_event_log(self):
+        """Start events.jsonl with the recording's metadata record."""
+        self.video_dir.mkdir(parents=True, exist_ok=True)
+        self.events_file = self.video_dir / "events.jsonl"
+        # Unbuffered, so the file stays valid up to the last record if we crash
+        self._event_log = open(self.events_file, "wb", buffering=0)
+        self._write_record({"type": "meta", "viewport": self.viewport, "url": self.url})
+
+    def _write_record(self, record: dict):
+        self._event_log.write(encode_record(record))
+
+    def log_event(self, event_type: str, x: int, y: int, label: str = ""):
+        """Log event for post-processing."""
+        ts = time.time() - self.recording_start_time
+        self._write_record({
+            "type": event_type,
+            "timestamp": round(ts, 3),
+            "x": x,
+            "y": y,
+            "label": label
+        })
+        if event_type == "click":
+            self.click_count += 1
+        logger.info(f"Event: {event_type} '{label}' at ({x}, {y}) @ {ts:.2f}s")
+
+    async def move_to(self, x: int, y: int, duration: float = 0.5):
+        """Smooth mouse movement."""
+        await self.move_through(np.array([x]), np.array([y]), duration)
+
+    async def move_through(self, xs: np.ndarray, ys: np.ndarray, duration: float = 0.5):
+        """Smoothly move through each (xs[i], ys[i]) in turn, taking duration per leg."""
+        steps = int(duration * 60)
+
+        t = np.linspace(0, 1, steps + 1)
+        t = t * t * (3 - 2 * t)  # Smoothstep
+        start_xs = np.concatenate(([self.mouse_x], xs[:-1]))
+        start_ys = np.concatenate(([self.mouse_y], ys[:-1]))
+        path_x = (start_xs[:, None] + (xs - start_xs)[:, None] * t).ravel()
+        path_y = (start_ys[:, None] + (ys - start_ys)[:, None] * t).ravel()
+
+        # The page plays the whole path on its own frame clock in one round trip
+        await self.page.evaluate(PLAY_CURSOR_JS, [path_x.tolist(), path_y.tolist(), 60])
+
+        # Real pointer event at the endpoint, so hover and click hit-testing land here
+        x, y = float(xs[-1]), float(ys[-1])
+        await self.page.mouse.move(x, y)
+        self.mouse_x, self.mouse_y = x, y
+
+    async def click_at(self, x: int, y: int, label: str):
+        """Move to position, log and perform a real click."""
+        await self.move_to(x, y, duration=0.3)
+        self.log_event("click", int(x), int(y), label)
+        # A click can navigate away, taking the page's samples with it
+        await self._drain_mouse_path()
+        await self.page.mouse.click(x, y)
+        # Settle time after the click; callers don't need their own pause
+        await asyncio.sleep(0.15)
+
+    async def scroll_to(self, y: float, duration: float = 1.0):
+        """Smooth scroll, played by the page in one round trip."""
+        await self.page.evaluate(SCROLL_TO_JS, [y, duration * 1000])
+
+    async def element_boxes(self, selectors: dict) -> dict:
+        """Look up the bounding boxes of several elements in one round trip."""
+        return await self.page.evaluate(ELEMENT_BOXES_JS, selectors)
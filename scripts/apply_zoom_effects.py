@@ -7,14 +7,29 @@ Creates multiple versions with different zoom intensities.
 Now with smooth animated zoom transitions (ZOOM-002).
 """
 
+import functools
+import heapq
 import json
 import math
+import os
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Callable, List, Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# Moving-average window for mouse-following pan (larger window handles teleport jumps)
+FOLLOW_SMOOTHING_WINDOW = 15
 
 
 @dataclass
@@ -39,55 +54,77 @@ class ZoomTriggerConfig:
             self.triggers = ['click', 'slow_down']
 
 
-def calculate_mouse_velocity(mouse_path: List[dict], time: float, window: float = 0.1) -> float:
+@dataclass
+class MousePath:
+    """Mouse tracking samples stored as parallel arrays, sorted by time."""
+    t: np.ndarray  # seconds since recording start
+    x: np.ndarray  # pixels
+    y: np.ndarray  # pixels
+
+    @classmethod
+    def from_records(cls, records: List[dict]) -> "MousePath":
+        """Build from the {t, x, y} records stored in events.json."""
+        n = len(records)
+        return cls(
+            t=np.fromiter((p["t"] for p in records), dtype=np.float64, count=n),
+            x=np.fromiter((p["x"] for p in records), dtype=np.float64, count=n),
+            y=np.fromiter((p["y"] for p in records), dtype=np.float64, count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+
+def calculate_mouse_velocity(mouse_path: MousePath, time: float, window: float = 0.1) -> float:
     """Calculate mouse velocity at a specific time.
 
     Args:
-        mouse_path: List of {t, x, y} position records
+        mouse_path: Mouse tracking samples
         time: Time to calculate velocity at
         window: Time window for velocity calculation (seconds)
 
     Returns:
         Velocity in pixels per second
     """
-    if not mouse_path or len(mouse_path) < 2:
+    if len(mouse_path) < 2:
         return 0.0
 
-    # Find positions within the time window
-    positions = []
-    for p in mouse_path:
-        if abs(p["t"] - time) <= window:
-            positions.append(p)
+    t_arr, x_arr, y_arr = mouse_path.t, mouse_path.x, mouse_path.y
 
-    if len(positions) < 2:
-        # Find nearest two positions
-        sorted_by_dist = sorted(mouse_path, key=lambda p: abs(p["t"] - time))
-        positions = sorted_by_dist[:2]
+    # Find positions within the time window
+    lo = int(np.searchsorted(t_arr, time - window, side="left"))
+    hi = int(np.searchsorted(t_arr, time + window, side="right"))
 
-    if len(positions) < 2:
-        return 0.0
+    if hi - lo >= 2:
+        i1, i2 = lo, hi - 1
+    else:
+        # Find nearest two positions; in a sorted path they sit next to the
+        # insertion point, so only a handful of candidates need comparing
+        # (widened to the first of any duplicate timestamps, as ties go to
+        # the earliest record)
+        idx = int(np.searchsorted(t_arr, time))
+        lo = int(np.searchsorted(t_arr, t_arr[max(0, idx - 2)]))
+        candidates = range(lo, min(len(t_arr), idx + 2))
+        i1, i2 = heapq.nsmallest(2, candidates, key=lambda i: abs(t_arr[i] - time))
 
     # Calculate velocity from first to last position in window
-    p1, p2 = positions[0], positions[-1]
-    dt = abs(p2["t"] - p1["t"])
+    dt = abs(t_arr[i2] - t_arr[i1])
     if dt < 0.001:
         return 0.0
 
-    dx = p2["x"] - p1["x"]
-    dy = p2["y"] - p1["y"]
-    distance = math.sqrt(dx * dx + dy * dy)
+    distance = math.hypot(x_arr[i2] - x_arr[i1], y_arr[i2] - y_arr[i1])
 
-    return distance / dt
+    return float(distance / dt)
 
 
 def analyze_mouse_velocity(
-    mouse_path: List[dict],
+    mouse_path: MousePath,
     sample_interval: float = 0.033,  # ~30fps
 ) -> List[dict]:
     """Analyze mouse velocity over time.
 
     Args:
-        mouse_path: List of {t, x, y} position records
+        mouse_path: Mouse tracking samples
         sample_interval: Time between velocity samples
 
     Returns:
@@ -96,45 +133,80 @@ def analyze_mouse_velocity(
     if not mouse_path:
         return []
 
-    velocities = []
-    start_time = mouse_path[0]["t"]
-    end_time = mouse_path[-1]["t"]
+    t_arr = mouse_path.t
+
+    sample_times = []
+    start_time = float(t_arr[0])
+    end_time = float(t_arr[-1])
 
     current_time = start_time
     while current_time <= end_time:
-        velocity = calculate_mouse_velocity(mouse_path, current_time)
+        sample_times.append(current_time)
+        current_time += sample_interval
 
-        # Find nearest position for coordinates
-        nearest = min(mouse_path, key=lambda p: abs(p["t"] - current_time))
+    # Find nearest position for coordinates with one binary search over all
+    # samples; ties resolve to the earliest record, as min() over the list did
+    times = np.array(sample_times, dtype=np.float64)
+    right = np.minimum(np.searchsorted(t_arr, times, side="left"), len(t_arr) - 1)
+    left = np.searchsorted(t_arr, t_arr[np.maximum(right - 1, 0)], side="left")
+    use_left = np.abs(times - t_arr[left]) <= np.abs(t_arr[right] - times)
+    nearest = np.where(use_left, left, right)
+
+    return [
+        {
+            "t": sample_time,
+            "velocity": calculate_mouse_velocity(mouse_path, sample_time),
+            "x": x,
+            "y": y
+        }
+        for sample_time, x, y in zip(
+            sample_times, mouse_path.x[nearest].tolist(), mouse_path.y[nearest].tolist()
+        )
+    ]
 
-        velocities.append({
-            "t": current_time,
-            "velocity": velocity,
-            "x": nearest["x"],
-            "y": nearest["y"]
-        })
-        current_time += sample_interval
 
-    return velocities
+def build_scroll_intervals(events: List[dict]) -> np.ndarray:
+    """Pair each scroll_start with the next scroll_end in a single pass.
 
+    Args:
+        events: All events from recording
+
+    Returns:
+        (K, 2) array of [start, end] times sorted by start, where the end
+        column holds the running maximum so overlapping intervals merge
+    """
+    intervals = []
+    next_end = None
+    for event in reversed(events):
+        if event["type"] == "scroll_end":
+            next_end = event["timestamp"]
+        elif event["type"] == "scroll_start" and next_end is not None:
+            intervals.append((event["timestamp"], next_end))
+
+    if not intervals:
+        return np.empty((0, 2), dtype=np.float64)
+
+    arr = np.array(intervals, dtype=np.float64)
+    arr = arr[np.argsort(arr[:, 0], kind="stable")]
+    arr[:, 1] = np.maximum.accumulate(arr[:, 1])
+    return arr
 
-def is_during_scroll(events: List[dict], time: float) -> bool:
-    """Check if time falls within a scroll event."""
-    for i, event in enumerate(events):
-        if event["type"] == "scroll_start":
-            # Find matching scroll_end
-            for j in range(i + 1, len(events)):
-                if events[j]["type"] == "scroll_end":
-                    if event["timestamp"] <= time <= events[j]["timestamp"]:
-                        return True
-                    break
-    return False
+
+def is_during_scroll(scroll_intervals: np.ndarray, time: float) -> bool:
+    """Check if time falls within a scroll event.
+
+    Args:
+        scroll_intervals: Intervals from build_scroll_intervals
+        time: Time to check
+    """
+    idx = int(np.searchsorted(scroll_intervals[:, 0], time, side="right")) - 1
+    return idx >= 0 and scroll_intervals[idx, 1] >= time
 
 
 def should_trigger_zoom(
     click: dict,
-    mouse_path: List[dict],
-    events: List[dict],
+    velocity_at: Optional[Callable[[float], float]],
+    scroll_intervals: np.ndarray,
     config: ZoomTriggerConfig,
 ) -> bool:
     """Determine if zoom should be triggered for a click event.
@@ -143,8 +215,8 @@ def should_trigger_zoom(
 
     Args:
         click: Click event {type, timestamp, x, y, label}
-        mouse_path: List of mouse positions from recording
-        events: All events from recording
+        velocity_at: Returns mouse velocity at a time, or None without mouse data
+        scroll_intervals: Scroll intervals from build_scroll_intervals
         config: Trigger configuration
 
     Returns:
@@ -155,20 +227,20 @@ def should_trigger_zoom(
     # Always trigger for explicit click triggers
     if 'click' in config.triggers and click["type"] == "click":
         # Check if we should skip during scroll
-        if config.skip_during_scroll and is_during_scroll(events, click_time):
+        if config.skip_during_scroll and is_during_scroll(scroll_intervals, click_time):
             return False
 
         # Check mouse velocity if slow_down trigger is enabled
-        if 'slow_down' in config.triggers and mouse_path:
-            velocity = calculate_mouse_velocity(mouse_path, click_time)
+        if 'slow_down' in config.triggers and velocity_at is not None:
+            velocity = velocity_at(click_time)
             if velocity > config.velocity_threshold * 3:  # Very fast = skip zoom
                 return False
 
         return True
 
     # Trigger based on slow-down (hover detection)
-    if 'slow_down' in config.triggers and mouse_path:
-        velocity = calculate_mouse_velocity(mouse_path, click_time)
+    if 'slow_down' in config.triggers and velocity_at is not None:
+        velocity = velocity_at(click_time)
         if velocity < config.velocity_threshold:
             return True
 
@@ -177,7 +249,7 @@ def should_trigger_zoom(
 
 def filter_zoom_triggers(
     events: List[dict],
-    mouse_path: List[dict],
+    mouse_path: Optional[MousePath],
     config: Optional[ZoomTriggerConfig] = None,
 ) -> List[dict]:
     """Filter click events to only include those that should trigger zoom.
@@ -196,8 +268,16 @@ def filter_zoom_triggers(
     clicks = [e for e in events if e["type"] == "click"]
     filtered = []
 
+    # Build the scroll intervals once rather than per click
+    scroll_intervals = build_scroll_intervals(events)
+    velocity_at = None
+    if mouse_path:
+        @functools.cache
+        def velocity_at(time: float) -> float:
+            return calculate_mouse_velocity(mouse_path, time)
+
     for click in clicks:
-        if should_trigger_zoom(click, mouse_path, events, config):
+        if should_trigger_zoom(click, velocity_at, scroll_intervals, config):
             filtered.append(click)
         else:
             print(f"  ⊘ Skipping zoom for '{click['label']}' (velocity too high or during scroll)")
@@ -205,18 +285,24 @@ def filter_zoom_triggers(
     return filtered
 
 
-def ease_out_cubic(t: float) -> float:
-    """Ease-out cubic for smooth zoom-in (fast start, slow end)."""
-    return 1 - pow(1 - t, 3)
+def ease_out_cubic(t):
+    """Ease-out cubic for smooth zoom-in (fast start, slow end).
+
+    Accepts a float or an ndarray of progress values.
+    """
+    return 1 - (1 - t) ** 3
+
 
+def ease_in_cubic(t):
+    """Ease-in cubic for smooth zoom-out (slow start, fast end).
 
-def ease_in_cubic(t: float) -> float:
-    """Ease-in cubic for smooth zoom-out (slow start, fast end)."""
+    Accepts a float or an ndarray of progress values.
+    """
     return t * t * t
 
 
-def interpolate_zoom(t: float, start_zoom: float, end_zoom: float, easing_fn) -> float:
-    """Interpolate zoom level with easing."""
+def interpolate_zoom(t, start_zoom: float, end_zoom: float, easing_fn):
+    """Interpolate zoom level with easing (t may be a float or an ndarray)."""
     eased_t = easing_fn(t)
     return start_zoom + (end_zoom - start_zoom) * eased_t
 
@@ -225,53 +311,82 @@ def interpolate_zoom(t: float, start_zoom: float, end_zoom: float, easing_fn) ->
 # ZOOM-003: Mouse-following pan during zoom
 # =============================================================================
 
-def interpolate_mouse_position(
-    mouse_path: List[dict],
-    time: float,
-) -> tuple:
-    """Interpolate mouse position at a specific time.
+def interpolate_positions_batch(mouse_path: MousePath, times: np.ndarray) -> tuple:
+    """Interpolate mouse positions at many times in one pass.
+
+    Positions are linearly interpolated between samples, clamped to the
+    path ends, and not interpolated across samples less than 1ms apart.
 
     Args:
-        mouse_path: List of {t, x, y} position records
-        time: Time to interpolate position at
+        mouse_path: Mouse tracking samples
+        times: Times to interpolate positions at
 
     Returns:
-        (x, y) tuple of interpolated position
+        (xs, ys) arrays of interpolated positions
     """
-    if not mouse_path:
-        return (0, 0)
-
-    # Handle edge cases
-    if time <= mouse_path[0]["t"]:
-        return (mouse_path[0]["x"], mouse_path[0]["y"])
-    if time >= mouse_path[-1]["t"]:
-        return (mouse_path[-1]["x"], mouse_path[-1]["y"])
+    t_arr, x_arr, y_arr = mouse_path.t, mouse_path.x, mouse_path.y
+    times = np.asarray(times, dtype=np.float64)
+    if len(t_arr) < 2:
+        if not len(t_arr):
+            return (np.zeros_like(times), np.zeros_like(times))
+        return (np.full_like(times, x_arr[0]), np.full_like(times, y_arr[0]))
 
     # Find surrounding positions for interpolation
-    for i in range(len(mouse_path) - 1):
-        p1 = mouse_path[i]
-        p2 = mouse_path[i + 1]
-        if p1["t"] <= time <= p2["t"]:
-            # Linear interpolation between points
-            dt = p2["t"] - p1["t"]
-            if dt < 0.001:
-                return (p1["x"], p1["y"])
-            t = (time - p1["t"]) / dt
-            x = p1["x"] + (p2["x"] - p1["x"]) * t
-            y = p1["y"] + (p2["y"] - p1["y"]) * t
-            return (x, y)
-
-    return (mouse_path[-1]["x"], mouse_path[-1]["y"])
+    i = np.clip(np.searchsorted(t_arr, times, side="left") - 1, 0, len(t_arr) - 2)
+
+    # Linear interpolation between points (none across sub-millisecond gaps)
+    dt = t_arr[i + 1] - t_arr[i]
+    t = np.divide(times - t_arr[i], dt, out=np.zeros_like(times), where=dt >= 0.001)
+    xs = x_arr[i] + (x_arr[i + 1] - x_arr[i]) * t
+    ys = y_arr[i] + (y_arr[i + 1] - y_arr[i]) * t
+
+    # Handle edge cases
+    after = times >= t_arr[-1]
+    xs[after], ys[after] = x_arr[-1], y_arr[-1]
+    before = times <= t_arr[0]
+    xs[before], ys[before] = x_arr[0], y_arr[0]
+    return (xs, ys)
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _rolling_mean(values: np.ndarray, half_window: int) -> np.ndarray:
+        """Centered moving average (truncated at the ends) via a rolling sum."""
+        n = values.shape[0]
+        out = np.empty_like(values)
+        total = 0.0
+        lo = 0
+        hi = 0
+        for i in range(n):
+            new_lo = max(0, i - half_window)
+            new_hi = min(n, i + half_window + 1)
+            while hi < new_hi:
+                total += values[hi]
+                hi += 1
+            while lo < new_lo:
+                total -= values[lo]
+                lo += 1
+            out[i] = total / (hi - lo)
+        return out
+else:
+    def _rolling_mean(values: np.ndarray, half_window: int) -> np.ndarray:
+        """Centered moving average (truncated at the ends) via a cumulative sum."""
+        n = values.shape[0]
+        csum = np.concatenate(([0.0], np.cumsum(values)))
+        idx = np.arange(n)
+        lo = np.maximum(0, idx - half_window)
+        hi = np.minimum(n, idx + half_window + 1)
+        return (csum[hi] - csum[lo]) / (hi - lo)
 
 
 def smooth_mouse_path(
-    mouse_path: List[dict],
+    mouse_path: MousePath,
     window_size: int = 5,
-) -> List[dict]:
+) -> MousePath:
     """Smooth mouse path using moving average to reduce jitter.
 
     Args:
-        mouse_path: List of {t, x, y} position records
+        mouse_path: Mouse tracking samples
         window_size: Number of samples for moving average
 
     Returns:
@@ -280,67 +395,12 @@ def smooth_mouse_path(
     if not mouse_path or len(mouse_path) < window_size:
         return mouse_path
 
-    smoothed = []
     half_window = window_size // 2
-
-    for i in range(len(mouse_path)):
-        # Gather samples within window
-        start_idx = max(0, i - half_window)
-        end_idx = min(len(mouse_path), i + half_window + 1)
-        window = mouse_path[start_idx:end_idx]
-
-        # Calculate average position
-        avg_x = sum(p["x"] for p in window) / len(window)
-        avg_y = sum(p["y"] for p in window) / len(window)
-
-        smoothed.append({
-            "t": mouse_path[i]["t"],
-            "x": avg_x,
-            "y": avg_y
-        })
-
-    return smoothed
-
-
-def calculate_pan_offset(
-    mouse_x: float,
-    mouse_y: float,
-    zoom_factor: float,
-    viewport_width: int,
-    viewport_height: int,
-) -> tuple:
-    """Calculate pan offset to keep cursor centered during zoom.
-
-    Args:
-        mouse_x: Current mouse X position
-        mouse_y: Current mouse Y position
-        zoom_factor: Current zoom level
-        viewport_width: Video width
-        viewport_height: Video height
-
-    Returns:
-        (pan_x, pan_y) normalized offset (0-1)
-    """
-    # Calculate crop dimensions at current zoom
-    crop_w = viewport_width / zoom_factor
-    crop_h = viewport_height / zoom_factor
-
-    # Calculate ideal crop position to center on mouse
-    ideal_x = mouse_x - crop_w / 2
-    ideal_y = mouse_y - crop_h / 2
-
-    # Clamp to valid range
-    ideal_x = max(0, min(ideal_x, viewport_width - crop_w))
-    ideal_y = max(0, min(ideal_y, viewport_height - crop_h))
-
-    # Convert to normalized coordinates
-    max_offset_x = viewport_width - crop_w
-    max_offset_y = viewport_height - crop_h
-
-    pan_x = ideal_x / max_offset_x if max_offset_x > 0 else 0.5
-    pan_y = ideal_y / max_offset_y if max_offset_y > 0 else 0.5
-
-    return (pan_x, pan_y)
+    return MousePath(
+        t=mouse_path.t,
+        x=_rolling_mean(mouse_path.x, half_window),
+        y=_rolling_mean(mouse_path.y, half_window),
+    )
 
 
 def generate_zoom_keyframes(
@@ -352,10 +412,11 @@ def generate_zoom_keyframes(
     hold_duration: float = 0.5,
     zoom_out_duration: float = 0.3,
     fps: float = 30,
-    mouse_path: Optional[List[dict]] = None,
+    mouse_path: Optional[MousePath] = None,
     viewport_width: int = 1280,
     viewport_height: int = 800,
     follow_mouse: bool = False,
+    smoothed_path: Optional[MousePath] = None,
 ) -> List[ZoomKeyframe]:
     """Generate keyframes for smooth zoom animation with optional mouse following.
 
@@ -372,39 +433,38 @@ def generate_zoom_keyframes(
         viewport_width: Video width for pan calculations
         viewport_height: Video height for pan calculations
         follow_mouse: Enable mouse-following pan during zoom
+        smoothed_path: mouse_path already passed through smooth_mouse_path;
+            pass it when generating keyframes for many clicks on one recording
     """
-    keyframes = []
-
     # IMPORTANT: Be fully zoomed IN by the time of the click
     # Zoom-in happens BEFORE the click, hold starts AT the click
     zoom_start = click_time - zoom_in_duration
 
-    # Smooth the mouse path if available (larger window handles teleport jumps)
-    smoothed_path = None
-    if follow_mouse and mouse_path:
-        smoothed_path = smooth_mouse_path(mouse_path, window_size=15)
+    # Smooth the mouse path if available and not already smoothed by the caller
+    if smoothed_path is None and follow_mouse and mouse_path:
+        smoothed_path = smooth_mouse_path(mouse_path, window_size=FOLLOW_SMOOTHING_WINDOW)
 
-    def get_pan_center(frame_time: float, zoom: float) -> tuple:
-        """Get mouse position (0-1 normalized) to center the view on."""
+    def get_pan_centers(frame_times: np.ndarray) -> tuple:
+        """Get mouse positions (0-1 normalized) to center the view on."""
         if not follow_mouse or not smoothed_path:
-            return (center_x, center_y)
+            return (np.full_like(frame_times, center_x), np.full_like(frame_times, center_y))
 
-        # Get interpolated mouse position at this time
-        mouse_x, mouse_y = interpolate_mouse_position(smoothed_path, frame_time)
+        # Get interpolated mouse positions at these times
+        mouse_x, mouse_y = interpolate_positions_batch(smoothed_path, frame_times)
 
-        # Return normalized mouse position (0-1)
-        # The zoom segment will center the view on this position
+        # Return normalized mouse positions (0-1)
+        # The zoom segment will center the view on these positions
         return (mouse_x / viewport_width, mouse_y / viewport_height)
 
     # Phase 1: Zoom in (use zoom_in_frames + 1 to include endpoint)
     zoom_in_frames = max(1, int(zoom_in_duration * fps))
-    for i in range(zoom_in_frames + 1):
-        t = i / zoom_in_frames if zoom_in_frames > 0 else 1.0
-        frame_time = zoom_start + t * zoom_in_duration
-        zoom = interpolate_zoom(t, 1.0, zoom_factor, ease_out_cubic)
-        # During zoom-in, center on the CLICK position (center_x, center_y)
-        # This ensures we zoom to where the action happens
-        keyframes.append(ZoomKeyframe(frame_time, zoom, center_x, center_y))
+    t = np.arange(zoom_in_frames + 1) / zoom_in_frames
+    in_times = zoom_start + t * zoom_in_duration
+    in_zoom = interpolate_zoom(t, 1.0, zoom_factor, ease_out_cubic)
+    # During zoom-in, center on the CLICK position (center_x, center_y)
+    # This ensures we zoom to where the action happens
+    in_x = np.full_like(t, center_x)
+    in_y = np.full_like(t, center_y)
 
     # Phase 2: Hold at max zoom (follow mouse during hold)
     # We blend from click position to mouse position over the first ~0.2s of hold
@@ -413,453 +473,482 @@ def generate_zoom_keyframes(
     hold_start = zoom_start + zoom_in_duration
     blend_duration = min(0.2, hold_duration * 0.4)  # Blend over first 40% of hold or 0.2s
 
-    for i in range(hold_frames):
-        frame_time = hold_start + i / fps
-        # Get the mouse position at this time
-        mouse_pan_x, mouse_pan_y = get_pan_center(frame_time, zoom_factor)
-
-        # Calculate blend factor (0 = click position, 1 = mouse position)
-        time_in_hold = frame_time - hold_start
-        if time_in_hold < blend_duration and blend_duration > 0:
-            blend = time_in_hold / blend_duration
-            # Use smoothstep for smooth transition
-            blend = blend * blend * (3 - 2 * blend)
-            pan_x = center_x + blend * (mouse_pan_x - center_x)
-            pan_y = center_y + blend * (mouse_pan_y - center_y)
-        else:
-            # After blend period, fully follow mouse
-            pan_x, pan_y = mouse_pan_x, mouse_pan_y
-
-        keyframes.append(ZoomKeyframe(frame_time, zoom_factor, pan_x, pan_y))
+    hold_times = hold_start + np.arange(hold_frames) / fps
+    # Get the mouse position at each hold frame
+    mouse_pan_x, mouse_pan_y = get_pan_centers(hold_times)
+    hold_zoom = np.full_like(hold_times, zoom_factor)
+
+    # Calculate blend factor (0 = click position, 1 = mouse position)
+    time_in_hold = hold_times - hold_start
+    if blend_duration > 0:
+        blending = time_in_hold < blend_duration
+        blend = time_in_hold / blend_duration
+        # Use smoothstep for smooth transition
+        blend = blend * blend * (3 - 2 * blend)
+        # After blend period, fully follow mouse
+        hold_x = np.where(blending, center_x + blend * (mouse_pan_x - center_x), mouse_pan_x)
+        hold_y = np.where(blending, center_y + blend * (mouse_pan_y - center_y), mouse_pan_y)
+    else:
+        hold_x, hold_y = mouse_pan_x, mouse_pan_y
 
     # Phase 3: Zoom out (use zoom_out_frames + 1 to include endpoint)
     zoom_out_frames = max(1, int(zoom_out_duration * fps))
     zoom_out_start = hold_start + hold_duration
-    for i in range(zoom_out_frames + 1):
-        t = i / zoom_out_frames if zoom_out_frames > 0 else 1.0
-        frame_time = zoom_out_start + t * zoom_out_duration
-        zoom = interpolate_zoom(t, zoom_factor, 1.0, ease_in_cubic)
-        # During zoom-out, follow mouse back to normal view
-        pan_x, pan_y = get_pan_center(frame_time, zoom)
-        keyframes.append(ZoomKeyframe(frame_time, zoom, pan_x, pan_y))
+    t = np.arange(zoom_out_frames + 1) / zoom_out_frames
+    out_times = zoom_out_start + t * zoom_out_duration
+    out_zoom = interpolate_zoom(t, zoom_factor, 1.0, ease_in_cubic)
+    # During zoom-out, follow mouse back to normal view
+    out_x, out_y = get_pan_centers(out_times)
 
-    return keyframes
+    # Build the keyframe objects once, from the concatenated phase arrays
+    times = np.concatenate((in_times, hold_times, out_times)).tolist()
+    zooms = np.concatenate((in_zoom, hold_zoom, out_zoom)).tolist()
+    xs = np.concatenate((in_x, hold_x, out_x)).tolist()
+    ys = np.concatenate((in_y, hold_y, out_y)).tolist()
 
+    return [ZoomKeyframe(*values) for values in zip(times, zooms, xs, ys)]
 
-def create_animated_zoom_segment(
-    input_video: str,
-    output_video: str,
-    keyframes: List[ZoomKeyframe],
-    width: int,
-    height: int,
-    fps: float,
-) -> bool:
-    """Create a segment with animated zoom - mouse centered in frame."""
-    if not keyframes:
-        return False
 
-    temp_dir = Path(tempfile.mkdtemp())
-    segments = []
+def run_silent(cmd: List[str]) -> bool:
+    """Run a command whose output is never read.
 
-    # Process each keyframe individually for smooth mouse following
-    for i, kf in enumerate(keyframes):
-        start_time = kf.time
-        end_time = keyframes[i + 1].time if i + 1 < len(keyframes) else kf.time + (1 / fps)
-        duration = end_time - start_time
+    Both streams go to /dev/null, so ffmpeg's progress chatter is never
+    buffered or decoded.
 
-        if duration <= 0:
-            continue
+    Returns:
+        True if the command exited successfully
+    """
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    return result.returncode == 0
 
-        # Calculate crop dimensions based on zoom
-        crop_w = int(width / kf.zoom)
-        crop_h = int(height / kf.zoom)
 
-        # center_x and center_y are the MOUSE POSITION (0-1 normalized)
-        # We want to CENTER the view on the mouse
-        mouse_x = kf.center_x * width
-        mouse_y = kf.center_y * height
+# Hardware H.264 encoders in order of preference, tuned to roughly match
+# the quality of the libx264 fallback
+HARDWARE_H264_ENCODERS = [
+    ("h264_nvenc", ("-preset", "p4", "-rc", "vbr", "-cq", "18")),
+    ("h264_qsv", ("-preset", "veryfast", "-global_quality", "18")),
+    ("h264_videotoolbox", ("-q:v", "65")),
+]
+SOFTWARE_H264_ARGS = ("-c:v", "libx264", "-preset", "fast", "-crf", "18")
 
-        # Calculate crop position to center on mouse
-        crop_x = int(mouse_x - crop_w / 2)
-        crop_y = int(mouse_y - crop_h / 2)
 
-        # Clamp to valid range (can't go off-screen)
-        crop_x = max(0, min(crop_x, width - crop_w))
-        crop_y = max(0, min(crop_y, height - crop_h))
+@functools.cache
+def h264_encoder_args() -> tuple:
+    """Pick the fastest H.264 encoder usable on this host.
 
-        # Make dimensions even
-        crop_w = crop_w - (crop_w % 2)
-        crop_h = crop_h - (crop_h % 2)
+    An encoder being compiled into ffmpeg doesn't mean the hardware is
+    present, so each listed candidate is tried on a tiny test clip. The
+    result is cached for the life of the process.
 
-        seg_file = temp_dir / f"frame_{i:04d}.mp4"
-        cmd = [
-            "ffmpeg", "-y",
-            "-ss", str(start_time),
-            "-i", input_video,
-            "-t", str(duration),
-            "-vf", f"crop={crop_w}:{crop_h}:{crop_x}:{crop_y},scale={width}:{height}",
-            "-c:v", "libx264", "-preset", "fast", "-crf", "18",
-            str(seg_file)
+    Returns:
+        ffmpeg codec arguments, e.g. ("-c:v", "h264_nvenc", "-preset", "p4", ...)
+    """
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-encoders"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    for encoder, options in HARDWARE_H264_ENCODERS:
+        if f" {encoder} " not in result.stdout:
+            continue
+        probe = [
+            "ffmpeg", "-hide_banner",
+            "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+            "-frames:v", "1",
+            "-c:v", encoder, *options,
+            "-f", "null", "-"
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if seg_file.exists() and seg_file.stat().st_size > 0:
-            segments.append(seg_file)
+        if run_silent(probe):
+            return ("-c:v", encoder, *options)
+    return SOFTWARE_H264_ARGS
 
-    if not segments:
-        return False
 
-    # Concatenate all segments
-    concat_file = temp_dir / "concat.txt"
-    with open(concat_file, "w") as f:
-        for seg in segments:
-            f.write(f"file '{seg}'\n")
+def hwaccel_decode_args() -> tuple:
+    """Decode on the GPU when a hardware encoder was picked.
 
-    cmd = [
-        "ffmpeg", "-y",
-        "-f", "concat", "-safe", "0",
-        "-i", str(concat_file),
-        "-c:v", "libx264", "-preset", "fast", "-crf", "18",
-        output_video
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    # Cleanup
-    for seg in segments:
-        seg.unlink()
-    concat_file.unlink()
-    temp_dir.rmdir()
+    A working hardware encoder means the matching decoder (NVDEC, QSV,
+    VideoToolbox) is there too, so decoding stays off the CPU as well.
+    ffmpeg hands decoded frames back to the CPU filters automatically and
+    falls back to software decoding if the codec isn't supported.
 
-    return result.returncode == 0
+    Returns:
+        ffmpeg input arguments, empty when encoding in software
+    """
+    if h264_encoder_args() == SOFTWARE_H264_ARGS:
+        return ()
+    return ("-hwaccel", "auto")
 
 
 def load_events(events_path: str) -> dict:
-    with open(events_path) as f:
-        return json.load(f)
+    """Load a recording's viewport, events and mouse path.
 
-
-# =============================================================================
-# ZOOM-006: Frame-by-frame rendering for precise control
-# =============================================================================
-
-def extract_frames(
-    input_video: str,
-    output_dir: Path,
-    fps: Optional[float] = None,
-) -> int:
-    """Extract all frames from video to PNG files.
+    Reads either an events.json bundle or the events.jsonl stream written by
+    the demo recorders: a meta record, one record per event and mouse_path
+    chunks of [t, x, y] samples. Both come back as the same dict layout.
 
     Args:
-        input_video: Path to input video
-        output_dir: Directory to save frames
-        fps: Optional frame rate (uses video's native fps if not specified)
+        events_path: Path to events.json or events.jsonl
 
     Returns:
-        Number of frames extracted
+        Dict with viewport, url, events and mouse_path
     """
-    output_dir.mkdir(exist_ok=True)
-
-    fps_filter = f"fps={fps}" if fps else "copy"
-    cmd = [
-        "ffmpeg", "-y",
-        "-i", input_video,
-        "-vf", fps_filter,
-        str(output_dir / "frame_%06d.png")
-    ]
+    if not events_path.endswith(".jsonl"):
+        with open(events_path) as f:
+            return json.load(f)
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    # Count extracted frames
-    frames = list(output_dir.glob("frame_*.png"))
-    return len(frames)
+    data = {"events": [], "mouse_path": []}
+    with open(events_path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A recording that was cut short may end mid-line
+                break
+            kind = record.get("type")
+            if kind == "meta":
+                data["viewport"] = record["viewport"]
+                data["url"] = record.get("url")
+            elif kind == "mouse_path":
+                data["mouse_path"].extend({"t": t, "x": x, "y": y} for t, x, y in record["data"])
+            else:
+                data["events"].append(record)
+    return data
 
 
-def process_single_frame(args: tuple) -> bool:
-    """Process a single frame with zoom/crop transformation and cursor overlay.
+# =============================================================================
+# ZOOM-006: Frame-by-frame rendering for precise control
+# =============================================================================
 
-    Args:
-        args: Tuple of (frame_path, output_path, crop_x, crop_y, crop_w, crop_h, width, height, mouse_x, mouse_y)
-              mouse_x, mouse_y are optional (can be None)
+# Cursor overlay boxes: (name, dx, dy, w, h, rgb, alpha, thickness).
+# Offsets are relative to the cursor position in the output frame; a
+# thickness of None fills the box.
+CURSOR_BOXES = [
+    ("fill", -12, -12, 24, 24, (255, 0, 0), 0.7, None),         # Red circle for cursor
+    ("outline", -14, -14, 28, 28, (255, 255, 255), 1.0, 2),     # White outline
+    ("stem", -2, -2, 4, 20, (0, 0, 0), 1.0, None),              # Black pointer shape
+    ("bar", -2, -2, 14, 4, (0, 0, 0), 1.0, None),
+]
+
+
+def drawbox_filter(name: str, x: int, y: int, w: int, h: int, rgb: tuple, alpha: float,
+                   thickness: Optional[int]) -> str:
+    """Format a CURSOR_BOXES entry as a named ffmpeg drawbox filter."""
+    color = "0x{:02x}{:02x}{:02x}@{}".format(*rgb, alpha)
+    t = "fill" if thickness is None else thickness
+    return f"drawbox@{name}=x={x}:y={y}:w={w}:h={h}:color={color}:t={t}"
+
+
+if HAS_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _frame_crops(
+        frame_times: np.ndarray,
+        kt: np.ndarray,
+        kz: np.ndarray,
+        kx: np.ndarray,
+        ky: np.ndarray,
+        width: int,
+        height: int,
+    ) -> np.ndarray:
+        """Crop table for compute_frame_transforms, one frame per loop iteration."""
+        n = frame_times.shape[0]
+        out = np.empty((n, 4), dtype=np.int64)
+        for j in prange(n):
+            t = frame_times[j]
+
+            # Default: no zoom (full frame)
+            zoom = 1.0
+            center_x = 0.5
+            center_y = 0.5
+            if kt.shape[0] >= 2 and kt[0] <= t <= kt[-1]:
+                i = max(np.searchsorted(kt, t) - 1, 0)
+                dt = kt[i + 1] - kt[i]
+                if dt > 0:
+                    frac = (t - kt[i]) / dt
+                    zoom = kz[i] + (kz[i + 1] - kz[i]) * frac
+                    center_x = kx[i] + (kx[i + 1] - kx[i]) * frac
+                    center_y = ky[i] + (ky[i + 1] - ky[i]) * frac
+                else:
+                    zoom = kz[i]
+                    center_x = kx[i]
+                    center_y = ky[i]
+
+            crop_w = int(width / zoom)
+            crop_h = int(height / zoom)
+            crop_x = max(0, min(int(center_x * width - crop_w / 2), width - crop_w))
+            crop_y = max(0, min(int(center_y * height - crop_h / 2), height - crop_h))
+            out[j, 0] = crop_x
+            out[j, 1] = crop_y
+            out[j, 2] = crop_w - crop_w % 2
+            out[j, 3] = crop_h - crop_h % 2
+        return out
+else:
+    def _frame_crops(
+        frame_times: np.ndarray,
+        kt: np.ndarray,
+        kz: np.ndarray,
+        kx: np.ndarray,
+        ky: np.ndarray,
+        width: int,
+        height: int,
+    ) -> np.ndarray:
+        """Crop table for compute_frame_transforms, all frames per array operation."""
+        n = frame_times.shape[0]
+
+        # Default: no zoom (full frame)
+        zoom = np.ones(n)
+        center_x = np.full(n, 0.5)
+        center_y = np.full(n, 0.5)
+
+        if len(kt) >= 2:
+            # Frames outside the keyframe range keep the defaults
+            inside = (kt[0] <= frame_times) & (frame_times <= kt[-1])
+            t = frame_times[inside]
+
+            # First segment with kt[i] <= t <= kt[i + 1]; zero-length segments
+            # hold the value of their first keyframe
+            i = np.maximum(np.searchsorted(kt, t, side="left") - 1, 0)
+            dt = kt[i + 1] - kt[i]
+            frac = np.divide(t - kt[i], dt, out=np.zeros_like(t), where=dt > 0)
+
+            zoom[inside] = kz[i] + (kz[i + 1] - kz[i]) * frac
+            center_x[inside] = kx[i] + (kx[i + 1] - kx[i]) * frac
+            center_y[inside] = ky[i] + (ky[i + 1] - ky[i]) * frac
+
+        crop_w = (width / zoom).astype(np.int64)
+        crop_h = (height / zoom).astype(np.int64)
+
+        # Center the crop on the mouse position, clamped to the frame
+        crop_x = np.clip((center_x * width - crop_w / 2).astype(np.int64), 0, width - crop_w)
+        crop_y = np.clip((center_y * height - crop_h / 2).astype(np.int64), 0, height - crop_h)
 
-    Returns:
-        True if successful
-    """
-    # Support both old (8-arg) and new (10-arg) format
-    if len(args) == 8:
-        frame_path, output_path, crop_x, crop_y, crop_w, crop_h, width, height = args
-        mouse_x, mouse_y = None, None
-    else:
-        frame_path, output_path, crop_x, crop_y, crop_w, crop_h, width, height, mouse_x, mouse_y = args
-
-    # Build filter chain
-    filters = [f"crop={crop_w}:{crop_h}:{crop_x}:{crop_y}", f"scale={width}:{height}"]
-
-    # Add cursor overlay if mouse position provided
-    if mouse_x is not None and mouse_y is not None:
-        # Calculate cursor position in the output frame
-        # 1. Position in cropped frame
-        cursor_in_crop_x = mouse_x - crop_x
-        cursor_in_crop_y = mouse_y - crop_y
-
-        # 2. Scale to output dimensions
-        scale_x = width / crop_w
-        scale_y = height / crop_h
-        final_cursor_x = int(cursor_in_crop_x * scale_x)
-        final_cursor_y = int(cursor_in_crop_y * scale_y)
-
-        # Only draw if cursor is within visible area
-        if 0 <= final_cursor_x < width and 0 <= final_cursor_y < height:
-            # Draw cursor using FFmpeg drawbox (simple but visible)
-            # Cursor: small filled circle with outline
-            cursor_size = 12
-            # Red circle for cursor
-            filters.append(
-                f"drawbox=x={final_cursor_x-cursor_size}:y={final_cursor_y-cursor_size}:"
-                f"w={cursor_size*2}:h={cursor_size*2}:color=red@0.7:t=fill"
-            )
-            # White outline
-            filters.append(
-                f"drawbox=x={final_cursor_x-cursor_size-2}:y={final_cursor_y-cursor_size-2}:"
-                f"w={cursor_size*2+4}:h={cursor_size*2+4}:color=white:t=2"
-            )
-            # Black pointer shape (arrow-like)
-            filters.append(
-                f"drawbox=x={final_cursor_x-2}:y={final_cursor_y-2}:w=4:h=20:color=black:t=fill"
-            )
-            filters.append(
-                f"drawbox=x={final_cursor_x-2}:y={final_cursor_y-2}:w=14:h=4:color=black:t=fill"
-            )
-
-    cmd = [
-        "ffmpeg", "-y",
-        "-i", str(frame_path),
-        "-vf", ",".join(filters),
-        "-q:v", "2",  # High quality
-        str(output_path)
-    ]
+        # Make dimensions even
+        crop_w -= crop_w % 2
+        crop_h -= crop_h % 2
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result.returncode == 0
+        return np.stack([crop_x, crop_y, crop_w, crop_h], axis=1)
 
 
-def reassemble_frames(
-    frames_dir: Path,
-    output_video: str,
+def compute_frame_transforms(
+    num_frames: int,
     fps: float,
+    keyframes: List[ZoomKeyframe],
     width: int,
     height: int,
-) -> bool:
-    """Reassemble processed frames into final video.
+) -> np.ndarray:
+    """Calculate the crop of every frame at once.
+
+    Zoom and center are interpolated between keyframes (frames outside
+    them are unzoomed), the crop is centered on the mouse position and
+    clamped to the frame, and its size is rounded down to even, for frames
+    0..num_frames-1.
 
     Args:
-        frames_dir: Directory containing processed frames
-        output_video: Output video path
-        fps: Frame rate
+        num_frames: Number of frames
+        fps: Video frame rate
+        keyframes: Zoom keyframes, sorted by time
         width: Video width
         height: Video height
 
     Returns:
-        True if successful
+        (num_frames, 4) int array of (crop_x, crop_y, crop_w, crop_h) rows
     """
-    cmd = [
-        "ffmpeg", "-y",
-        "-framerate", str(fps),
-        "-i", str(frames_dir / "processed_%06d.png"),
-        "-c:v", "libx264",
-        "-preset", "fast",
-        "-crf", "18",
-        "-pix_fmt", "yuv420p",
-        "-s", f"{width}x{height}",
-        output_video
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result.returncode == 0
+    return _frame_crops(
+        np.arange(num_frames) / fps,
+        np.array([kf.time for kf in keyframes], dtype=np.float64),
+        np.array([kf.zoom for kf in keyframes], dtype=np.float64),
+        np.array([kf.center_x for kf in keyframes], dtype=np.float64),
+        np.array([kf.center_y for kf in keyframes], dtype=np.float64),
+        width,
+        height,
+    )
 
 
-def calculate_frame_transform(
-    frame_num: int,
-    fps: float,
-    keyframes: List[ZoomKeyframe],
+def build_frame_commands(
+    crops: np.ndarray,
     width: int,
     height: int,
-) -> tuple:
-    """Calculate crop transformation for a specific frame.
+    fps: float,
+    mouse_path: Optional[MousePath] = None,
+    label: str = "v0",
+) -> str:
+    """Build a sendcmd script that sets the crop and cursor of every frame.
+
+    A command is only emitted for frames where the crop or cursor changes.
+    Frames past the end of the crop table keep its last row, and the cursor
+    stays put after the mouse path ends, so the script stops there.
 
     Args:
-        frame_num: Frame number (0-indexed)
-        fps: Video frame rate
-        keyframes: Zoom keyframes
+        crops: (N, 4) crop table, e.g. from compute_frame_transforms
         width: Video width
         height: Video height
+        fps: Video frame rate
+        mouse_path: Optional mouse positions for cursor overlay
+        label: Filter chain label; commands target crop@{label} and
+            drawbox@{label}_{box name}
 
     Returns:
-        (crop_x, crop_y, crop_w, crop_h) for this frame
+        sendcmd script targeting the crop filter and the CURSOR_BOXES drawboxes
     """
-    frame_time = frame_num / fps
-
-    # Default: no zoom (full frame)
-    zoom = 1.0
-    center_x = 0.5
-    center_y = 0.5
-
-    # Find if this frame falls within any keyframe range
-    # Keyframes are sorted by time, but may have gaps between zoom segments
-    if keyframes:
-        # Check if frame_time falls within the keyframe range
-        first_kf_time = keyframes[0].time
-        last_kf_time = keyframes[-1].time
-
-        if first_kf_time <= frame_time <= last_kf_time:
-            # Frame is within keyframe range - find exact position
-            for i in range(len(keyframes) - 1):
-                kf1 = keyframes[i]
-                kf2 = keyframes[i + 1]
-                if kf1.time <= frame_time <= kf2.time:
-                    dt = kf2.time - kf1.time
-                    if dt > 0:
-                        t = (frame_time - kf1.time) / dt
-                        zoom = kf1.zoom + (kf2.zoom - kf1.zoom) * t
-                        center_x = kf1.center_x + (kf2.center_x - kf1.center_x) * t
-                        center_y = kf1.center_y + (kf2.center_y - kf1.center_y) * t
-                    else:
-                        zoom = kf1.zoom
-                        center_x = kf1.center_x
-                        center_y = kf1.center_y
-                    break
-        # else: frame is outside keyframe range, keep zoom=1.0 (no zoom)
-
-    # Calculate crop dimensions
-    crop_w = int(width / zoom)
-    crop_h = int(height / zoom)
-
-    # center_x/center_y are MOUSE POSITION (0-1 normalized)
-    # Center the crop ON the mouse position
-    mouse_x = center_x * width
-    mouse_y = center_y * height
-    crop_x = int(mouse_x - crop_w / 2)
-    crop_y = int(mouse_y - crop_h / 2)
-
-    # Clamp to valid range (can't go off-screen)
-    crop_x = max(0, min(crop_x, width - crop_w))
-    crop_y = max(0, min(crop_y, height - crop_h))
-
-    # Make dimensions even
-    crop_w = crop_w - (crop_w % 2)
-    crop_h = crop_h - (crop_h % 2)
-
-    return (crop_x, crop_y, crop_w, crop_h)
-
-
-def render_zoom_frame_by_frame(
+    num_frames = len(crops)
+    if mouse_path:
+        num_frames = max(num_frames, int(float(mouse_path.t[-1]) * fps) + 2)
+
+    # Frames past the end of the table keep its last row
+    frame_crops = crops[np.minimum(np.arange(num_frames), len(crops) - 1)]
+    crop_changed = np.ones(num_frames, dtype=bool)
+    crop_changed[1:] = np.any(frame_crops[1:] != frame_crops[:-1], axis=1)
+
+    # Cursor position of every frame, mapped into the zoomed output. A hidden
+    # cursor is parked outside the frame, which is also where it starts.
+    cursor_changed = np.zeros(num_frames, dtype=bool)
+    if mouse_path:
+        mouse_x, mouse_y = interpolate_positions_batch(mouse_path, np.arange(num_frames) / fps)
+        crop_x, crop_y, crop_w, crop_h = frame_crops.T
+        cursor_x = ((mouse_x.astype(np.int64) - crop_x) * (width / crop_w)).astype(np.int64)
+        cursor_y = ((mouse_y.astype(np.int64) - crop_y) * (height / crop_h)).astype(np.int64)
+        hidden = (cursor_x < 0) | (cursor_x >= width) | (cursor_y < 0) | (cursor_y >= height)
+        cursor_x[hidden] = -width
+        cursor_y[hidden] = -height
+        cursor_changed[0] = not hidden[0]
+        cursor_changed[1:] = (cursor_x[1:] != cursor_x[:-1]) | (cursor_y[1:] != cursor_y[:-1])
+        cursor_x, cursor_y = cursor_x.tolist(), cursor_y.tolist()
+
+    crop_rows = frame_crops.tolist()
+    crop_target = f"crop@{label}"
+    lines = []
+    for frame_num in np.flatnonzero(crop_changed | cursor_changed).tolist():
+        commands = []
+        if crop_changed[frame_num]:
+            crop_x, crop_y, crop_w, crop_h = crop_rows[frame_num]
+            commands.append(
+                f"{crop_target} w {crop_w}, {crop_target} h {crop_h}, "
+                f"{crop_target} x {crop_x}, {crop_target} y {crop_y}"
+            )
+
+        if cursor_changed[frame_num]:
+            for name, dx, dy, *_ in CURSOR_BOXES:
+                box_target = f"drawbox@{label}_{name}"
+                commands.append(
+                    f"{box_target} x {cursor_x[frame_num] + dx}, "
+                    f"{box_target} y {cursor_y[frame_num] + dy}"
+                )
+
+        # Fire half a frame early so timestamp rounding can't delay a command
+        command_time = max(0.0, (frame_num - 0.5) / fps)
+        lines.append(f"{command_time:.4f} {', '.join(commands)};\n")
+
+    return "".join(lines)
+
+
+def render_crops(
     input_video: str,
-    output_video: str,
-    keyframes: List[ZoomKeyframe],
+    renders: List[tuple],
     width: int,
     height: int,
     fps: float,
-    parallel: bool = True,
-    max_workers: int = 4,
-    mouse_path: Optional[List[dict]] = None,
 ) -> bool:
-    """Render zoom effect frame-by-frame for precise control.
+    """Crop every frame to its row of a crop table and scale it back up.
 
-    This is a fallback method when FFmpeg filter expressions are insufficient.
-    It provides exact per-frame zoom and pan control at the cost of speed.
+    Each crop table is fed to ffmpeg as a sendcmd script (see
+    build_frame_commands). All outputs are rendered by a single ffmpeg
+    process: the input is decoded once and split into one crop chain per
+    output, so decode, crop, scale and encode never leave ffmpeg.
 
     Args:
         input_video: Path to input video
-        output_video: Path to output video
-        keyframes: List of zoom keyframes
+        renders: (output_video, crops, mouse_path) per output, where crops is
+            an (N, 4) crop table (frames past the end keep the last row) and
+            mouse_path is optional mouse positions for cursor overlay
         width: Video width
         height: Video height
         fps: Video frame rate
-        parallel: Use parallel processing
-        max_workers: Number of parallel workers
-        mouse_path: Optional mouse positions for cursor overlay
 
     Returns:
         True if successful
     """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
-    temp_dir = Path(tempfile.mkdtemp())
-    frames_dir = temp_dir / "frames"
-    processed_dir = temp_dir / "processed"
-    frames_dir.mkdir()
-    processed_dir.mkdir()
-
-    print(f"  Extracting frames from {input_video}...")
-    num_frames = extract_frames(input_video, frames_dir, fps)
-    print(f"  Extracted {num_frames} frames")
-
-    if num_frames == 0:
-        print("  Error: No frames extracted")
-        return False
-
-    # Prepare frame processing arguments
-    frame_args = []
-    for i in range(1, num_frames + 1):
-        frame_path = frames_dir / f"frame_{i:06d}.png"
-        output_path = processed_dir / f"processed_{i:06d}.png"
+    with tempfile.TemporaryDirectory() as td:
+        split_labels = "".join(f"[in{i}]" for i in range(len(renders)))
+        graph = [f"[0:v]fps={fps},split={len(renders)}{split_labels}"]
+
+        for i, (_, crops, mouse_path) in enumerate(renders):
+            label = f"v{i}"
+            cmd_file = Path(td) / f"frame_cmds_{label}.txt"
+            cmd_file.write_text(build_frame_commands(crops, width, height, fps, mouse_path, label))
+
+            # crop starts at full frame and is resized by the commands. The null
+            # filter keeps scale's input link at the original size, so scale sees
+            # the new frame size and reinitializes instead of misreading the buffer.
+            # Cropping in RGB keeps odd crop offsets exact instead of snapping
+            # them to the chroma grid.
+            filters = [
+                f"sendcmd=f='{cmd_file}'",
+                "format=rgb24",
+                f"crop@{label}={width}:{height}:0:0",
+                "null",
+                f"scale={width}:{height}",
+            ]
+            if mouse_path:
+                # Cursor boxes start hidden; the script moves them into view.
+                # drawbox only alpha-blends properly on RGB input.
+                filters.append("format=rgb24")
+                for name, _, _, w, h, rgb, alpha, thickness in CURSOR_BOXES:
+                    filters.append(drawbox_filter(
+                        f"{label}_{name}", -width, -height, w, h, rgb, alpha, thickness
+                    ))
+            graph.append(f"[in{i}]{','.join(filters)}[out{i}]")
 
-        crop_x, crop_y, crop_w, crop_h = calculate_frame_transform(
-            i - 1, fps, keyframes, width, height
+        cmd = [
+            "ffmpeg", "-y",
+            *hwaccel_decode_args(),
+            "-i", input_video,
+            "-filter_complex", ";".join(graph),
+        ]
+        # The outputs are encoded concurrently, each by its own encoder.
+        # Split the cores between them rather than letting every encoder
+        # start a thread per core.
+        encoder_threads = ()
+        if len(renders) > 1:
+            threads = max(1, (os.cpu_count() or 1) // len(renders))
+            encoder_threads = ("-threads", str(threads))
+
+        # Unzoomed stretches are re-encoded too: recordings are VP8/VP9 WebM,
+        # which can't be stream-copied into an H.264 MP4. They still cost
+        # only one encode, since the whole output comes from this one pass.
+        for i, (output_video, _, _) in enumerate(renders):
+            cmd += [
+                "-map", f"[out{i}]", "-map", "0:a?",
+                *h264_encoder_args(),
+                *encoder_threads,
+                "-pix_fmt", "yuv420p",
+                output_video
+            ]
+        # Only errors are logged, so stderr stays small enough to capture
+        # and its tail is worth showing if the render fails
+        cmd[1:1] = ["-loglevel", "error"]
+        result = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, errors="replace"
         )
 
-        # Get mouse position for this frame (for cursor overlay)
-        frame_time = (i - 1) / fps
-        mouse_x, mouse_y = None, None
-        if mouse_path:
-            mx, my = interpolate_mouse_position(mouse_path, frame_time)
-            mouse_x, mouse_y = int(mx), int(my)
-
-        frame_args.append((
-            frame_path, output_path,
-            crop_x, crop_y, crop_w, crop_h,
-            width, height,
-            mouse_x, mouse_y
-        ))
-
-    # Process frames
-    print(f"  Processing {num_frames} frames...")
-    processed = 0
-
-    if parallel:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(process_single_frame, args): i for i, args in enumerate(frame_args)}
-            for future in as_completed(futures):
-                if future.result():
-                    processed += 1
-                if processed % 100 == 0:
-                    print(f"    Processed {processed}/{num_frames} frames...")
-    else:
-        for args in frame_args:
-            if process_single_frame(args):
-                processed += 1
-            if processed % 100 == 0:
-                print(f"    Processed {processed}/{num_frames} frames...")
-
-    print(f"  Processed {processed}/{num_frames} frames")
+    if result.returncode != 0:
+        print(f"✗ Error: {result.stderr[-300:]}")
+        return False
+    return True
 
-    # Reassemble video
-    print(f"  Reassembling video...")
-    success = reassemble_frames(processed_dir, output_video, fps, width, height)
 
-    # Cleanup
-    import shutil
-    shutil.rmtree(temp_dir)
+def get_video_info(video_path: str) -> dict:
+    """Get video duration and fps.
 
-    if success:
-        size_mb = Path(output_video).stat().st_size / (1024 * 1024)
-        print(f"  ✓ Frame-by-frame output: {output_video} ({size_mb:.1f} MB)")
-        return True
-    else:
-        print("  ✗ Failed to reassemble video")
-        return False
+    Probed once per file version; the cache is keyed on modification time
+    and size so a re-recorded video is probed again.
+    """
+    stat = os.stat(video_path)
+    return dict(_probe_video_info(video_path, stat.st_mtime_ns, stat.st_size))
 
 
-def get_video_info(video_path: str) -> dict:
-    """Get video duration and fps."""
+@functools.lru_cache(maxsize=32)
+def _probe_video_info(video_path: str, mtime_ns: int, size: int) -> tuple:
+    """Run ffprobe for get_video_info (mtime_ns and size only key the cache)."""
     cmd = [
         "ffprobe", "-v", "error",
         "-select_streams", "v:0",
@@ -878,75 +967,27 @@ def get_video_info(video_path: str) -> dict:
 
     duration = float(data.get("format", {}).get("duration", 10))
 
-    return {"duration": duration, "fps": fps}
+    return (("duration", duration), ("fps", fps))
 
 
-def create_zoom_segment(
+def plan_zoom_at_clicks(
     input_video: str,
-    output_video: str,
-    start_time: float,
-    end_time: float,
-    zoom_center_x: float,  # 0-1
-    zoom_center_y: float,  # 0-1
-    zoom_factor: float,
-    width: int,
-    height: int,
-):
-    """Create a zoomed segment using crop+scale."""
-
-    # Calculate crop dimensions
-    crop_w = int(width / zoom_factor)
-    crop_h = int(height / zoom_factor)
-
-    # Calculate crop position centered on the click point
-    crop_x = int((width - crop_w) * zoom_center_x)
-    crop_y = int((height - crop_h) * zoom_center_y)
-
-    # Clamp to valid range
-    crop_x = max(0, min(crop_x, width - crop_w))
-    crop_y = max(0, min(crop_y, height - crop_h))
-
-    # Make dimensions even (required by libx264)
-    crop_w = crop_w - (crop_w % 2)
-    crop_h = crop_h - (crop_h % 2)
-
-    duration = end_time - start_time
-
-    cmd = [
-        "ffmpeg", "-y",
-        "-ss", str(start_time),
-        "-i", input_video,
-        "-t", str(duration),
-        "-vf", f"crop={crop_w}:{crop_h}:{crop_x}:{crop_y},scale={width}:{height}",
-        "-c:v", "libx264",
-        "-preset", "fast",
-        "-crf", "18",
-        output_video
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result.returncode == 0
-
-
-def apply_zoom_at_clicks(
-    input_video: str,
-    output_video: str,
     events: list,
     viewport: dict,
     zoom_factor: float = 1.5,
     zoom_duration: float = 1.0,
     animated: bool = True,
     smart_triggers: bool = False,
-    mouse_path: Optional[List[dict]] = None,
+    mouse_path: Optional[MousePath] = None,
     trigger_config: Optional[ZoomTriggerConfig] = None,
     follow_mouse: bool = False,
     frame_by_frame: bool = False,
-):
-    """Apply zoom effects with smooth animated transitions.
+    video_info: Optional[dict] = None,
+) -> Optional[tuple]:
+    """Work out the crop of every frame for zoom effects at clicks.
 
     Args:
         input_video: Path to input video file
-        output_video: Path to output video file
         events: List of events from events.json
         viewport: Viewport dimensions {width, height}
         zoom_factor: Maximum zoom level (1.5 = 50% zoom)
@@ -957,8 +998,14 @@ def apply_zoom_at_clicks(
         trigger_config: Configuration for smart trigger detection
         follow_mouse: Enable mouse-following pan during zoom (ZOOM-003)
         frame_by_frame: Use frame-by-frame rendering for precise control (ZOOM-006)
+        video_info: Result of get_video_info(input_video), if already known
+
+    Returns:
+        (crops, cursor_path) for render_crops, where cursor_path is the mouse
+        path to draw a cursor from (frame-by-frame only), or None if there is
+        nothing to zoom
     """
-    # Force frame-by-frame for mouse following - segment approach is too choppy
+    # Force frame-by-frame for mouse following so the cursor overlay is drawn
     if follow_mouse and mouse_path and not frame_by_frame:
         print("  → Using frame-by-frame rendering for smooth mouse following")
         frame_by_frame = True
@@ -974,10 +1021,10 @@ def apply_zoom_at_clicks(
         clicks = filter_zoom_triggers(events, mouse_path, trigger_config)
         if not clicks:
             print("No zoom triggers detected after velocity analysis!")
-            return False
+            return None
     elif not clicks:
         print("No click events found!")
-        return False
+        return None
 
     mode = "animated" if animated else "hard-cut"
     if frame_by_frame:
@@ -986,7 +1033,7 @@ def apply_zoom_at_clicks(
     pan_mode = " + mouse-following" if follow_mouse and mouse_path else ""
     print(f"\nApplying {zoom_factor}x {mode} zoom at {len(clicks)} click points{trigger_mode}{pan_mode}...")
 
-    info = get_video_info(input_video)
+    info = video_info or get_video_info(input_video)
     total_duration = info["duration"]
     fps = info["fps"]
 
@@ -1002,8 +1049,12 @@ def apply_zoom_at_clicks(
         hold_dur = zoom_duration
         zoom_out_dur = 0
 
-    # FRAME-BY-FRAME: Process entire video in one pass with all keyframes
-    if frame_by_frame:
+    # Smooth the mouse path once for all clicks
+    smoothed_path = None
+    if follow_mouse and mouse_path:
+        smoothed_path = smooth_mouse_path(mouse_path, window_size=FOLLOW_SMOOTHING_WINDOW)
+
+    if frame_by_frame or animated:
         # Generate ALL keyframes for ALL clicks
         all_keyframes = []
         for click in clicks:
@@ -1024,6 +1075,7 @@ def apply_zoom_at_clicks(
                 viewport_width=width,
                 viewport_height=height,
                 follow_mouse=follow_mouse,
+                smoothed_path=smoothed_path,
             )
             all_keyframes.extend(keyframes)
             print(f"  Generated {len(keyframes)} keyframes for: {click['label']}")
@@ -1032,82 +1084,23 @@ def apply_zoom_at_clicks(
         all_keyframes.sort(key=lambda kf: kf.time)
         print(f"  Total keyframes: {len(all_keyframes)}")
 
-        # Process entire video with all keyframes (pass mouse_path for cursor overlay)
-        success = render_zoom_frame_by_frame(
-            input_video, output_video, all_keyframes, width, height, fps,
-            mouse_path=mouse_path
+        # Crops for every frame up to just past the last keyframe
+        last_time = all_keyframes[-1].time
+        crops = compute_frame_transforms(
+            int(last_time * fps) + 2, fps, all_keyframes, width, height
         )
+    else:
+        # Hard cut: a fixed crop for the whole zoom window of each click,
+        # full frame everywhere else
+        frame_times = np.arange(int(total_duration * fps) + 2) / fps
+        crops = np.tile([0, 0, width, height], (len(frame_times), 1))
 
-        if success:
-            size_mb = Path(output_video).stat().st_size / (1024 * 1024)
-            print(f"✓ Output: {output_video} ({size_mb:.1f} MB)")
-            return True
-        else:
-            print(f"✗ Frame-by-frame rendering failed")
-            return False
-
-    # SEGMENT-BASED: Original approach for non-frame-by-frame
-    temp_dir = Path(tempfile.mkdtemp())
-    segments = []
-    concat_file = temp_dir / "concat.txt"
-
-    current_time = 0
-    segment_idx = 0
-
-    for click in clicks:
-        click_time = click["timestamp"]
-        zoom_start = click_time - zoom_in_dur
-        zoom_end = zoom_start + zoom_in_dur + hold_dur + zoom_out_dur
-
-        # Segment before zoom (normal)
-        if current_time < zoom_start:
-            seg_file = temp_dir / f"seg_{segment_idx:03d}_normal.mp4"
-            cmd = [
-                "ffmpeg", "-y",
-                "-ss", str(current_time),
-                "-i", input_video,
-                "-t", str(zoom_start - current_time),
-                "-c:v", "libx264", "-preset", "fast", "-crf", "18",
-                str(seg_file)
-            ]
-            subprocess.run(cmd, capture_output=True)
-            if seg_file.exists() and seg_file.stat().st_size > 0:
-                segments.append(seg_file)
-                segment_idx += 1
-
-        # Zoomed segment
-        px = click["x"] / width
-        py = click["y"] / height
-        actual_end = min(zoom_end, total_duration)
-
-        if animated:
-            keyframes = generate_zoom_keyframes(
-                click_time=click_time,
-                center_x=px,
-                center_y=py,
-                zoom_factor=zoom_factor,
-                zoom_in_duration=zoom_in_dur,
-                hold_duration=hold_dur,
-                zoom_out_duration=zoom_out_dur,
-                fps=fps,
-                mouse_path=mouse_path,
-                viewport_width=width,
-                viewport_height=height,
-                follow_mouse=follow_mouse,
-            )
-
-            seg_file = temp_dir / f"seg_{segment_idx:03d}_zoom_animated.mp4"
-            success = create_animated_zoom_segment(
-                input_video, str(seg_file), keyframes, width, height, fps
-            )
+        for click in clicks:
+            zoom_start = click["timestamp"] - zoom_in_dur
+            actual_end = min(zoom_start + hold_dur, total_duration)
+            px = click["x"] / width
+            py = click["y"] / height
 
-            if success and seg_file.exists() and seg_file.stat().st_size > 0:
-                segments.append(seg_file)
-                print(f"  ✓ Animated zoom: {click['label']} ({zoom_start:.2f}s - {actual_end:.2f}s)")
-                segment_idx += 1
-        else:
-            # Hard cut zoom
-            seg_file = temp_dir / f"seg_{segment_idx:03d}_zoom.mp4"
             crop_w = int(width / zoom_factor)
             crop_h = int(height / zoom_factor)
             crop_x = max(0, min(int((width - crop_w) * px), width - crop_w))
@@ -1115,72 +1108,87 @@ def apply_zoom_at_clicks(
             crop_w = crop_w - (crop_w % 2)
             crop_h = crop_h - (crop_h % 2)
 
-            cmd = [
-                "ffmpeg", "-y",
-                "-ss", str(zoom_start),
-                "-i", input_video,
-                "-t", str(actual_end - zoom_start),
-                "-vf", f"crop={crop_w}:{crop_h}:{crop_x}:{crop_y},scale={width}:{height}",
-                "-c:v", "libx264", "-preset", "fast", "-crf", "18",
-                str(seg_file)
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if seg_file.exists() and seg_file.stat().st_size > 0:
-                segments.append(seg_file)
-                print(f"  ✓ Zoom segment: {click['label']} ({zoom_start:.2f}s - {actual_end:.2f}s)")
-                segment_idx += 1
+            crops[(zoom_start <= frame_times) & (frame_times < actual_end)] = (
+                crop_x, crop_y, crop_w, crop_h
+            )
+            print(f"  Zoom: {click['label']} ({zoom_start:.2f}s - {actual_end:.2f}s)")
 
-        current_time = actual_end
+    # Cursor overlay in frame-by-frame mode
+    return crops, (mouse_path if frame_by_frame else None)
 
-    # Final segment after last zoom
-    if current_time < total_duration:
-        seg_file = temp_dir / f"seg_{segment_idx:03d}_normal.mp4"
-        cmd = [
-            "ffmpeg", "-y",
-            "-ss", str(current_time),
-            "-i", input_video,
-            "-t", str(total_duration - current_time),
-            "-c:v", "libx264", "-preset", "fast", "-crf", "18",
-            str(seg_file)
-        ]
-        subprocess.run(cmd, capture_output=True)
-        if seg_file.exists() and seg_file.stat().st_size > 0:
-            segments.append(seg_file)
 
-    # Write concat file
-    with open(concat_file, "w") as f:
-        for seg in segments:
-            f.write(f"file '{seg}'\n")
 
-    # Concatenate all segments
-    print(f"\nConcatenating {len(segments)} segments...")
-    cmd = [
-        "ffmpeg", "-y",
-        "-f", "concat",
-        "-safe", "0",
-        "-i", str(concat_file),
-        "-c:v", "libx264",
-        "-preset", "fast",
-        "-crf", "18",
-        output_video
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+def apply_zoom_at_clicks(
+    input_video: str,
+    output_video: str,
+    events: list,
+    viewport: dict,
+    zoom_factor: float = 1.5,
+    zoom_duration: float = 1.0,
+    animated: bool = True,
+    smart_triggers: bool = False,
+    mouse_path: Optional[MousePath] = None,
+    trigger_config: Optional[ZoomTriggerConfig] = None,
+    follow_mouse: bool = False,
+    frame_by_frame: bool = False,
+    video_info: Optional[dict] = None,
+):
+    """Apply zoom effects with smooth animated transitions.
 
-    # Cleanup
-    for seg in segments:
-        seg.unlink()
-    concat_file.unlink()
-    temp_dir.rmdir()
+    Args:
+        input_video: Path to input video file
+        output_video: Path to output video file
+        events: List of events from events.json
+        viewport: Viewport dimensions {width, height}
+        zoom_factor: Maximum zoom level (1.5 = 50% zoom)
+        zoom_duration: Total duration of zoom effect
+        animated: Use smooth animated transitions (True) or hard cuts (False)
+        smart_triggers: Use intelligent zoom trigger detection (ZOOM-004)
+        mouse_path: Mouse position tracking data for smart triggers
+        trigger_config: Configuration for smart trigger detection
+        follow_mouse: Enable mouse-following pan during zoom (ZOOM-003)
+        frame_by_frame: Use frame-by-frame rendering for precise control (ZOOM-006)
+        video_info: Result of get_video_info(input_video), if already known
+    """
+    info = video_info or get_video_info(input_video)
+    plan = plan_zoom_at_clicks(
+        input_video, events, viewport,
+        zoom_factor=zoom_factor,
+        zoom_duration=zoom_duration,
+        animated=animated,
+        smart_triggers=smart_triggers,
+        mouse_path=mouse_path,
+        trigger_config=trigger_config,
+        follow_mouse=follow_mouse,
+        frame_by_frame=frame_by_frame,
+        video_info=info,
+    )
+    if plan is None:
+        return False
+
+    crops, cursor_path = plan
+    success = render_crops(
+        input_video, [(output_video, crops, cursor_path)],
+        viewport["width"], viewport["height"], info["fps"],
+    )
 
-    if result.returncode == 0:
+    if success:
         size_mb = Path(output_video).stat().st_size / (1024 * 1024)
         print(f"✓ Output: {output_video} ({size_mb:.1f} MB)")
         return True
     else:
-        print(f"✗ Error: {result.stderr[-300:]}")
+        print("✗ Rendering failed")
         return False
 
 
+# Versions rendered by create_zoom_versions: (filename, name, zoom_factor, zoom_duration)
+ZOOM_VERSIONS = [
+    ("v1_subtle_zoom.mp4", "Subtle", 1.3, 0.8),
+    ("v2_medium_zoom.mp4", "Medium", 1.5, 1.0),
+    ("v3_dramatic_zoom.mp4", "Dramatic", 2.0, 1.2),
+]
+
+
 def create_zoom_versions(
     recording_dir: str,
     animated: bool = True,
@@ -1192,7 +1200,8 @@ def create_zoom_versions(
     """Create multiple versions with different zoom levels.
 
     Args:
-        recording_dir: Path to recording directory containing video and events.json
+        recording_dir: Path to recording directory containing video and events.jsonl
+            (or events.json)
         animated: Use smooth animated zoom transitions (True) or hard cuts (False)
         smart_triggers: Use intelligent zoom trigger detection (ZOOM-004)
         trigger_config: Configuration for smart trigger detection
@@ -1200,7 +1209,9 @@ def create_zoom_versions(
         frame_by_frame: Use frame-by-frame rendering for precise control (ZOOM-006)
     """
     recording_dir = Path(recording_dir)
-    events_file = recording_dir / "events.json"
+    events_file = recording_dir / "events.jsonl"
+    if not events_file.exists():
+        events_file = recording_dir / "events.json"
 
     video_files = list(recording_dir.glob("*.webm"))
     if not video_files:
@@ -1209,6 +1220,7 @@ def create_zoom_versions(
 
     input_video = str(video_files[0])
     events_data = load_events(str(events_file))
+    video_info = get_video_info(input_video)
 
     mode_label = "Frame-by-Frame" if frame_by_frame else ("Smooth Animated" if animated else "Hard Cut")
     trigger_label = " + Smart Triggers" if smart_triggers else ""
@@ -1220,9 +1232,9 @@ def create_zoom_versions(
     print(f"Viewport: {events_data['viewport']}")
 
     # Check for mouse_path data
-    mouse_path = events_data.get("mouse_path", [])
+    mouse_path = MousePath.from_records(events_data.get("mouse_path", []))
     if mouse_path:
-        print(f"Mouse tracking: {len(mouse_path)} positions (~30fps)")
+        print(f"Mouse tracking: {len(mouse_path)} positions")
         if smart_triggers:
             # Analyze and show velocity stats
             velocities = analyze_mouse_velocity(mouse_path)
@@ -1244,71 +1256,51 @@ def create_zoom_versions(
     for c in clicks:
         print(f"  - {c['label']} at ({c['x']}, {c['y']}) @ {c['timestamp']:.2f}s")
 
-    # Version 1: Subtle zoom
-    print("\n" + "-" * 40)
-    print(f"VERSION 1: Subtle {mode_label} Zoom (1.3x)")
-    print("-" * 40)
-    apply_zoom_at_clicks(
-        input_video,
-        str(recording_dir / "v1_subtle_zoom.mp4"),
-        events_data["events"],
-        events_data["viewport"],
-        zoom_factor=1.3,
-        zoom_duration=0.8,
-        animated=animated,
-        smart_triggers=smart_triggers,
-        mouse_path=mouse_path,
-        trigger_config=trigger_config,
-        follow_mouse=follow_mouse,
-        frame_by_frame=frame_by_frame,
-    )
-
-    # Version 2: Medium zoom
-    print("\n" + "-" * 40)
-    print(f"VERSION 2: Medium {mode_label} Zoom (1.5x)")
-    print("-" * 40)
-    apply_zoom_at_clicks(
-        input_video,
-        str(recording_dir / "v2_medium_zoom.mp4"),
-        events_data["events"],
-        events_data["viewport"],
-        zoom_factor=1.5,
-        zoom_duration=1.0,
-        animated=animated,
-        smart_triggers=smart_triggers,
-        mouse_path=mouse_path,
-        trigger_config=trigger_config,
-        follow_mouse=follow_mouse,
-        frame_by_frame=frame_by_frame,
-    )
-
-    # Version 3: Dramatic zoom
-    print("\n" + "-" * 40)
-    print(f"VERSION 3: Dramatic {mode_label} Zoom (2.0x)")
-    print("-" * 40)
-    apply_zoom_at_clicks(
-        input_video,
-        str(recording_dir / "v3_dramatic_zoom.mp4"),
-        events_data["events"],
-        events_data["viewport"],
-        zoom_factor=2.0,
-        zoom_duration=1.2,
-        animated=animated,
-        smart_triggers=smart_triggers,
-        mouse_path=mouse_path,
-        trigger_config=trigger_config,
-        follow_mouse=follow_mouse,
-        frame_by_frame=frame_by_frame,
-    )
+    # Plan every version first, then render them all from a single decode
+    renders = []
+    for number, (filename, name, zoom_factor, zoom_duration) in enumerate(ZOOM_VERSIONS, 1):
+        print("\n" + "-" * 40)
+        print(f"VERSION {number}: {name} {mode_label} Zoom ({zoom_factor}x)")
+        print("-" * 40)
+        plan = plan_zoom_at_clicks(
+            input_video,
+            events_data["events"],
+            events_data["viewport"],
+            zoom_factor=zoom_factor,
+            zoom_duration=zoom_duration,
+            animated=animated,
+            smart_triggers=smart_triggers,
+            mouse_path=mouse_path,
+            trigger_config=trigger_config,
+            follow_mouse=follow_mouse,
+            frame_by_frame=frame_by_frame,
+            video_info=video_info,
+        )
+        if plan is not None:
+            crops, cursor_path = plan
+            renders.append((str(recording_dir / filename), crops, cursor_path))
+
+    if renders:
+        print(f"\nRendering {len(renders)} versions in a single ffmpeg pass...")
+        viewport = events_data["viewport"]
+        if not render_crops(
+            input_video, renders, viewport["width"], viewport["height"], video_info["fps"]
+        ):
+            print("✗ Rendering failed")
 
     print("\n" + "=" * 60)
     print("POST-PROCESSING COMPLETE")
     print("=" * 60)
     print(f"\nOutput files:")
-    for f in sorted(recording_dir.glob("v*.mp4")):
-        if f.stat().st_size > 0:
-            size_mb = f.stat().st_size / (1024 * 1024)
-            print(f"  - {f.name} ({size_mb:.1f} MB)")
+    with os.scandir(recording_dir) as entries:
+        outputs = sorted(
+            (e for e in entries if e.name.startswith("v") and e.name.endswith(".mp4")),
+            key=lambda e: e.name,
+        )
+    for entry in outputs:
+        size = entry.stat().st_size
+        if size > 0:
+            print(f"  - {entry.name} ({size / (1024 * 1024):.1f} MB)")
 
 
 if __name__ == "__main__":
@@ -18,9 +18,42 @@ Page Structure (total height: ~9838px):
 """
 
 import asyncio
-from playwright.async_api import async_playwright
 from datetime import datetime
-import math
+
+from _demo_base import close_browser, get_browser
+
+
+# easeInOutCubic scroll run on the page's animation frames; resolves when it lands.
+# Scrolls shorter than min_distance are skipped.
+SMOOTH_SCROLL_JS = """([target, durationMs, minDistance]) => new Promise(resolve => {
+    const start = window.scrollY, distance = target - start;
+    if (Math.abs(distance) < minDistance) return resolve();
+    const t0 = performance.now();
+    const frame = (now) => {
+        const p = Math.min(1, (now - t0) / durationMs);
+        const eased = p < 0.5 ? 4 * p * p * p : 1 - Math.pow(-2 * p + 2, 3) / 2;
+        window.scrollTo(0, start + distance * eased);
+        if (p < 1) requestAnimationFrame(frame); else resolve();
+    };
+    requestAnimationFrame(frame);
+})"""
+
+# Subtle up-down motion (±amplitude px at frequency Hz) around the current scroll
+# position, run on animation frames; settles back on the start position.
+SUBTLE_MOTION_JS = """([durationMs, amplitude, frequency]) => new Promise(resolve => {
+    const startY = window.scrollY, t0 = performance.now();
+    const frame = (now) => {
+        const elapsed = now - t0;
+        if (elapsed >= durationMs) {
+            window.scrollTo(0, startY);
+            return resolve();
+        }
+        const offset = amplitude * Math.sin(2 * Math.PI * frequency * elapsed / 1000);
+        window.scrollTo(0, startY + offset);
+        requestAnimationFrame(frame);
+    };
+    requestAnimationFrame(frame);
+})"""
 
 
 class LandingPageDemo:
@@ -62,12 +95,10 @@ class LandingPageDemo:
             {"name": "final_cta", "position": 9038, "pause": 3.0, "scroll_duration": 2.5, "description": "Final CTA with stats"},
         ]
 
-    async def setup(self):
-        """Initialize browser and page with recording capabilities."""
-        playwright = await async_playwright().start()
-
-        self.browser = await playwright.chromium.launch(
-            headless=False,  # Show browser for visual feedback
+    async def setup(self, browser=None):
+        """Initialize browser (or use the one given) and page with recording capabilities."""
+        # Shown (not headless) for visual feedback
+        self.browser = browser or await get_browser(
             args=[
                 "--disable-blink-features=AutomationControlled",
                 "--start-maximized"
@@ -79,6 +110,7 @@ class LandingPageDemo:
         self.context = await self.browser.new_context(
             viewport=self.viewport,
             record_video_dir=self.output_dir,
+            # Full viewport size; if unset Playwright scales it down to fit 800x800
             record_video_size=self.viewport
         )
 
@@ -108,61 +140,39 @@ class LandingPageDemo:
         """
         Perform smooth eased scrolling to a target position.
         Uses easeInOutCubic for natural motion.
+        The whole scroll runs in the page, so it costs one round trip.
         """
-        current_y = await self.page.evaluate("window.scrollY")
-        distance = target_y - current_y
-
-        if abs(distance) < 10:
-            return
-
-        steps = int(duration * 60)  # 60fps
-
-        for step in range(steps + 1):
-            progress = step / steps
-            # easeInOutCubic easing function
-            if progress < 0.5:
-                eased = 4 * progress * progress * progress
-            else:
-                eased = 1 - pow(-2 * progress + 2, 3) / 2
-
-            scroll_y = current_y + (distance * eased)
-            await self.page.evaluate(f"window.scrollTo(0, {scroll_y})")
-            await asyncio.sleep(1/60)  # ~60fps
+        await self.page.evaluate(SMOOTH_SCROLL_JS, [target_y, duration * 1000, 10])
 
     async def pause_with_subtle_motion(self, duration: float):
         """
         Pause at a section with subtle micro-movements for visual interest.
+        The page runs the whole pause itself, so it costs one round trip.
         """
-        # Small oscillating movements to keep the video feeling alive
-        start_y = await self.page.evaluate("window.scrollY")
-        oscillations = int(duration * 2)  # 2 oscillations per second
+        # Small oscillating movements (±3 pixels, 2 per second) to keep the video feeling alive
+        await self.page.evaluate(SUBTLE_MOTION_JS, [duration * 1000, 3, 2])
 
-        for i in range(oscillations):
-            # Subtle up-down motion (±3 pixels)
-            offset = 3 * math.sin(i * math.pi)
-            await self.page.evaluate(f"window.scrollTo(0, {start_y + offset})")
-            await asyncio.sleep(duration / oscillations)
-
-        # Return to exact position
-        await self.page.evaluate(f"window.scrollTo(0, {start_y})")
+    async def _section(self, selector: str):
+        """Scope locators to the first section matching selector, or the whole page."""
+        section = self.page.locator(selector).first
+        return section if await section.count() else self.page
 
     async def interact_with_faq(self):
         """Open and close FAQ accordions for visual interest."""
         print("Interacting with FAQ section...")
 
-        # Click first FAQ item
+        # Open and close the first two FAQ items; locators resolve one button per
+        # click instead of fetching a handle for every matching button on the page
         try:
-            faq_buttons = await self.page.query_selector_all('button[class*="cursor-pointer"]')
-            if len(faq_buttons) >= 3:
-                await faq_buttons[0].click()
-                await asyncio.sleep(1.5)
-                await faq_buttons[0].click()
-                await asyncio.sleep(0.5)
-
-                await faq_buttons[1].click()
-                await asyncio.sleep(1.5)
-                await faq_buttons[1].click()
-                await asyncio.sleep(0.5)
+            faq = await self._section('#faq, [data-section="faq"]')
+            faq_buttons = faq.locator('button[class*="cursor-pointer"]')
+            if await faq_buttons.count() >= 3:
+                for i in range(2):
+                    button = faq_buttons.nth(i)
+                    await button.click()
+                    await asyncio.sleep(1.5)
+                    await button.click()
+                    await asyncio.sleep(0.5)
         except Exception as e:
             print(f"FAQ interaction skipped: {e}")
 
@@ -172,20 +182,21 @@ class LandingPageDemo:
 
         try:
             # Find pricing card containers
-            cards = await self.page.query_selector_all('[class*="pricing"], [class*="card"]')
-            for card in cards[:3]:  # First 3 pricing cards
-                await card.hover()
+            pricing = await self._section('#pricing, [data-section="pricing"]')
+            cards = pricing.locator('[class*="pricing"], [class*="card"]')
+            for i in range(min(3, await cards.count())):  # First 3 pricing cards
+                await cards.nth(i).hover()
                 await asyncio.sleep(0.8)
         except Exception as e:
             print(f"Pricing hover skipped: {e}")
 
-    async def run_demo(self):
+    async def run_demo(self, browser=None):
         """Execute the full demo recording sequence."""
         print("\n" + "="*60)
         print("TCG ELEVATE LANDING PAGE DEMO")
         print("="*60 + "\n")
 
-        await self.setup()
+        await self.setup(browser)
         await self.navigate()
 
         # Initial pause at hero
@@ -221,17 +232,15 @@ class LandingPageDemo:
         await self.cleanup()
 
     async def cleanup(self):
-        """Close browser and save recording."""
+        """Close this demo's context and save recording."""
         if self.page:
             video_path = await self.page.video.path()
             print(f"\nRecording saved to: {video_path}")
 
+        # The browser is shared and closed by main()
         if self.context:
             await self.context.close()
 
-        if self.browser:
-            await self.browser.close()
-
 
 async def main():
     """Main entry point for the demo script."""
@@ -240,7 +249,10 @@ async def main():
         output_dir="./recordings"
     )
 
-    await demo.run_demo()
+    try:
+        await demo.run_demo()
+    finally:
+        await close_browser()
 
 
 if __name__ == "__main__":
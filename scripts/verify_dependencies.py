@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """Verify that all dependencies for ProgrammaticDemo are properly installed."""
 
+import importlib
 import shutil
-import subprocess
 import sys
+from typing import List, Tuple
 
 
 def check_python_version() -> bool:
@@ -16,25 +17,42 @@ def check_python_version() -> bool:
     return False
 
 
-def check_system_command(cmd: str, name: str) -> bool:
-    """Check if a system command is available."""
+def check_system_command(cmd: str, name: str) -> Tuple[bool, str]:
+    """Check if a system command is available.
+
+    Returns:
+        (found, report line) so each group prints once it is complete.
+    """
     path = shutil.which(cmd)
     if path:
-        print(f"✓ {name} ({path})")
-        return True
-    print(f"✗ {name} not found")
-    return False
+        return True, f"✓ {name} ({path})"
+    return False, f"✗ {name} not found"
 
 
-def check_python_package(package: str) -> bool:
-    """Check if a Python package is importable."""
+def check_python_package(package: str) -> Tuple[bool, str]:
+    """Check if a Python package is importable.
+
+    Returns:
+        (importable, report line) so each group prints once it is complete.
+    """
+    # Already imported: no need to ask the import machinery
+    if package in sys.modules:
+        return True, f"✓ {package}"
     try:
-        __import__(package)
-        print(f"✓ {package}")
-        return True
+        importlib.import_module(package)
     except ImportError:
-        print(f"✗ {package}")
-        return False
+        return False, f"✗ {package}"
+    except Exception as e:
+        # Installed, but fails at import time (pyautogui without a DISPLAY)
+        return False, f"✗ {package} (import failed: {type(e).__name__}: {e})"
+    return True, f"✓ {package}"
+
+
+def report(results: List[Tuple[bool, str]]) -> bool:
+    """Print check results in order and return whether all of them passed."""
+    for _, line in results:
+        print(line)
+    return all(ok for ok, _ in results)
 
 
 def main() -> int:
@@ -49,26 +67,25 @@ def main() -> int:
         all_passed = False
     print()
 
-    # System commands
-    print("System Commands:")
     system_commands = [
         ("ffmpeg", "FFmpeg (screen recording)"),
         ("tesseract", "Tesseract (OCR)"),
         ("tmux", "tmux (terminal multiplexing)"),
     ]
-    for cmd, name in system_commands:
-        if not check_system_command(cmd, name):
-            all_passed = False
-    print()
-
-    # Optional system commands
-    print("Optional System Commands:")
     optional_commands = [
         ("yabai", "yabai (window management)"),
         ("ghostty", "Ghostty (terminal emulator)"),
     ]
-    for cmd, name in optional_commands:
-        check_system_command(cmd, name)  # Don't fail on optional
+    # System commands
+    print("System Commands:")
+    if not report([check_system_command(cmd, name) for cmd, name in system_commands]):
+        all_passed = False
+    print()
+
+    # Optional system commands
+    print("Optional System Commands:")
+    # Don't fail on optional
+    report([check_system_command(cmd, name) for cmd, name in optional_commands])
     print()
 
     # Python packages
@@ -83,9 +100,8 @@ def main() -> int:
         "pytesseract",
         "cv2",  # opencv-python
     ]
-    for package in packages:
-        if not check_python_package(package):
-            all_passed = False
+    if not report([check_python_package(p) for p in packages]):
+        all_passed = False
     print()
 
     # Summary
@@ -1,9 +1,18 @@
 """Actuators for controlling OS inputs."""
 
-from programmatic_demo.actuators.browser import Browser
 from programmatic_demo.actuators.keyboard import Keyboard
 from programmatic_demo.actuators.mouse import Mouse
 from programmatic_demo.actuators.terminal import Terminal
 from programmatic_demo.actuators.window import Window
 
 __all__ = ["Terminal", "Keyboard", "Mouse", "Window", "Browser"]
+
+
+def __getattr__(name: str):
+    # Browser is resolved on first access so importing the package doesn't
+    # pull in its dependencies
+    if name == "Browser":
+        from programmatic_demo.actuators.browser import Browser
+
+        return Browser
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,59 @@
 """Browser automation using Playwright."""
 
+import os
+from functools import cache, lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
-
 from programmatic_demo.utils.output import error_response, success_response
 
+# Headful, fullscreen Chromium
+DEFAULT_LAUNCH_ARGS = ("--start-maximized", "--start-fullscreen")
+
+# Chromium profile kept between runs, so its caches stay warm
+PROFILE_DIR = Path.home() / ".pdemo" / "chrome-profile"
+
+PAGE_STATE_JS = """() => ({
+    url: location.href,
+    title: document.title,
+    viewport: {width: window.innerWidth, height: window.innerHeight},
+})"""
+
+
+@cache
+def _sync_api() -> ModuleType:
+    """Import playwright.sync_api on first use.
+
+    It is slow to import, and most CLI commands never touch the browser.
+    """
+    from playwright import sync_api
+
+    return sync_api
+
+
+@lru_cache(maxsize=128)
+def _resolve_dir(directory: str) -> Path:
+    """Resolve symlinks in an absolute directory path, once per directory."""
+    return Path(directory).resolve()
+
+
+def prepare_screenshot_path(path: str) -> Path:
+    """Resolve a screenshot file path.
+
+    The directory needn't exist: Playwright creates it when it writes the
+    screenshot, so a directory deleted between shots is simply re-created.
+
+    Args:
+        path: Requested output path, absolute or relative.
+
+    Returns:
+        The absolute path to write the screenshot to.
+    """
+    # Made absolute first, so the cache stays right after a chdir
+    directory, name = os.path.split(os.path.abspath(path))
+    return _resolve_dir(directory) / name
+
 
 class Browser:
     """Browser controller using Playwright in headful mode."""
@@ -17,6 +64,8 @@ class Browser:
         self._browser = None
         self._context = None
         self._page = None
+        self._launch_args: tuple[str, ...] | None = None
+        self._persistent = False
 
     def _ensure_browser(self) -> dict[str, Any] | None:
         """Check if browser is running, return error dict if not."""
@@ -29,45 +78,110 @@ class Browser:
             )
         return None
 
-    def launch(self, url: str | None = None) -> dict[str, Any]:
+    def _page_state(self) -> dict[str, Any]:
+        """Read url, title and viewport size from the page in one round trip."""
+        return self._page.evaluate(PAGE_STATE_JS)
+
+    def _is_running(self) -> bool:
+        """Whether a launched Chromium is still up."""
+        if self._browser is not None:
+            return self._browser.is_connected()
+        # A persistent context is its own browser; _on_persistent_close
+        # drops it when it goes away
+        return self._persistent and self._context is not None
+
+    def _on_persistent_close(self, _context: Any) -> None:
+        """Forget a persistent context closed outside of close()."""
+        self._context = None
+        self._page = None
+
+    def launch(
+        self,
+        url: str | None = None,
+        force: bool = False,
+        args: tuple[str, ...] = DEFAULT_LAUNCH_ARGS,
+        persistent: bool = False,
+    ) -> dict[str, Any]:
         """Launch browser and optionally navigate to URL.
 
+        A Chromium already launched with the same options is reused and only
+        gets a fresh page (persistent) or context, skipping the Playwright
+        driver and browser start-up.
+
         Args:
             url: Optional URL to navigate to after launch.
+            force: Restart Playwright and Chromium even if they are running.
+            args: Chromium command-line arguments.
+            persistent: Use the profile in PROFILE_DIR, keeping its disk cache
+                between runs. Off by default: cookies and storage then carry
+                over between scenes, and only one process can hold the
+                profile at a time.
 
         Returns:
             Success dict with browser info.
         """
         try:
-            # Close existing browser if any
-            if self._browser is not None:
-                self.close()
-
-            # Start Playwright
-            self._playwright = sync_playwright().start()
-
-            # Launch Chromium in headful mode, fullscreen
-            self._browser = self._playwright.chromium.launch(
-                headless=False,
-                args=["--start-maximized", "--start-fullscreen"],
-            )
-
-            # Create context with no fixed viewport so it uses full screen size
-            self._context = self._browser.new_context(
-                no_viewport=True,
+            reuse = (
+                not force
+                and self._is_running()
+                and self._launch_args == args
+                and self._persistent == persistent
             )
-            self._page = self._context.new_page()
+            if reuse and persistent:
+                # The context is the browser; swap in a fresh page only
+                old_page = self._page
+                self._page = self._context.new_page()
+                if old_page:
+                    old_page.close()
+            elif reuse:
+                self._close_context()
+            else:
+                # Close existing browser if any
+                if self._playwright is not None:
+                    self.close()
+
+                # Start Playwright
+                self._playwright = _sync_api().sync_playwright().start()
+
+                # Launch Chromium in headful mode
+                if persistent:
+                    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+                    self._context = self._playwright.chromium.launch_persistent_context(
+                        user_data_dir=str(PROFILE_DIR),
+                        headless=False,
+                        no_viewport=True,
+                        args=list(args),
+                    )
+                    self._context.on("close", self._on_persistent_close)
+                    pages = self._context.pages
+                    self._page = pages[0] if pages else self._context.new_page()
+                else:
+                    self._browser = self._playwright.chromium.launch(
+                        headless=False,
+                        args=list(args),
+                    )
+                self._launch_args = args
+                self._persistent = persistent
+
+            if not persistent:
+                # Create context with no fixed viewport so it uses full screen size
+                self._context = self._browser.new_context(
+                    no_viewport=True,
+                )
+                self._page = self._context.new_page()
 
             result = {
                 "browser": "chromium",
                 "headless": False,
+                "persistent": persistent,
+                "reused": reuse,
             }
 
             # Navigate to URL if provided
             if url:
                 self._page.goto(url, wait_until="domcontentloaded")
                 result["url"] = url
-                result["title"] = self._page.title()
+                result["title"] = self._page_state()["title"]
 
             return success_response("browser_launch", result)
 
@@ -94,12 +208,13 @@ class Browser:
 
         try:
             self._page.goto(url, wait_until="domcontentloaded")
+            state = self._page_state()
 
             return success_response(
                 "browser_navigate",
                 {
-                    "url": self._page.url,
-                    "title": self._page.title(),
+                    "url": state["url"],
+                    "title": state["title"],
                 },
             )
         except Exception as e:
@@ -129,7 +244,7 @@ class Browser:
                 "browser_click",
                 {"selector": selector},
             )
-        except PlaywrightTimeout:
+        except _sync_api().TimeoutError:
             return error_response(
                 "element_not_found",
                 f"Element not found: {selector}",
@@ -164,7 +279,7 @@ class Browser:
                 "browser_fill",
                 {"selector": selector, "value": value},
             )
-        except PlaywrightTimeout:
+        except _sync_api().TimeoutError:
             return error_response(
                 "element_not_found",
                 f"Input element not found: {selector}",
@@ -198,7 +313,7 @@ class Browser:
                 "browser_wait_for",
                 {"selector": selector, "found": True},
             )
-        except PlaywrightTimeout:
+        except _sync_api().TimeoutError:
             return error_response(
                 "timeout",
                 f"Element '{selector}' not found after {timeout}s",
@@ -222,16 +337,11 @@ class Browser:
             return error
 
         try:
-            viewport = self._page.viewport_size
+            # Measured in the page: the context has no fixed viewport, so
+            # page.viewport_size would be None
+            state = self._page_state()
 
-            return success_response(
-                "browser_state",
-                {
-                    "url": self._page.url,
-                    "title": self._page.title(),
-                    "viewport": viewport,
-                },
-            )
+            return success_response("browser_state", state)
         except Exception as e:
             return error_response(
                 "state_failed",
@@ -253,10 +363,8 @@ class Browser:
             return error
 
         try:
-            file_path = Path(path).resolve()
-
-            # Create parent directories if needed
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            # Parent resolved once; later shots there skip the syscalls
+            file_path = prepare_screenshot_path(path)
 
             self._page.screenshot(path=str(file_path))
 
@@ -277,6 +385,20 @@ class Browser:
                 recoverable=True,
             )
 
+    def _close_context(self) -> None:
+        """Close the current page and context.
+
+        A non-persistent browser keeps running; a persistent one closes with
+        its context.
+        """
+        if self._page:
+            self._page.close()
+            self._page = None
+
+        if self._context:
+            self._context.close()
+            self._context = None
+
     def close(self) -> dict[str, Any]:
         """Close browser.
 
@@ -284,18 +406,14 @@ class Browser:
             Success dict.
         """
         try:
-            if self._page:
-                self._page.close()
-                self._page = None
-
-            if self._context:
-                self._context.close()
-                self._context = None
+            self._close_context()
 
             if self._browser:
                 self._browser.close()
                 self._browser = None
 
+            self._launch_args = None
+
             if self._playwright:
                 self._playwright.stop()
                 self._playwright = None
@@ -308,6 +426,7 @@ class Browser:
             self._context = None
             self._browser = None
             self._playwright = None
+            self._launch_args = None
 
             return error_response(
                 "close_failed",
@@ -0,0 +1,141 @@
+"""Run a short browser flow on Playwright's async API.
+
+A flow is a list of (action, argument) steps, e.g.::
+
+    [("goto", "https://example.com"), ("wait", "#hero"), ("wait", "footer"),
+     ("screenshot", "hero.png")]
+
+Steps run in order, except that consecutive waits (and consecutive
+screenshots) don't depend on each other and are awaited together, so a run of
+them costs the slowest one rather than their sum.
+"""
+
+import asyncio
+from itertools import groupby
+from typing import Any
+
+from programmatic_demo.actuators.browser import DEFAULT_LAUNCH_ARGS, prepare_screenshot_path
+from programmatic_demo.utils.output import error_response, success_response
+
+FLOW_ACTIONS = ("goto", "wait", "click", "screenshot")
+
+# Actions that only observe the page, so a run of them can be awaited together
+_CONCURRENT_ACTIONS = ("wait", "screenshot")
+
+
+async def _run_step(page: Any, action: str, arg: str, timeout: int) -> dict[str, Any] | None:
+    """Run one step, returning its screenshot info if it took one."""
+    if action == "goto":
+        await page.goto(arg, wait_until="domcontentloaded")
+    elif action == "wait":
+        await page.wait_for_selector(arg, timeout=timeout * 1000)
+    elif action == "click":
+        await page.click(arg)
+    elif action == "screenshot":
+        file_path = prepare_screenshot_path(arg)
+        await page.screenshot(path=str(file_path))
+        return {"path": str(file_path), "size": file_path.stat().st_size}
+    return None
+
+
+def _invalid_steps(message: str) -> dict[str, Any]:
+    """Error response for a malformed flow."""
+    return error_response(
+        "invalid_step",
+        message,
+        recoverable=True,
+        suggestion=f'Steps are [action, argument] pairs, e.g. [["goto", "https://example.com"]]; '
+        f"valid actions: {', '.join(FLOW_ACTIONS)}",
+    )
+
+
+def _validate_steps(steps: Any) -> list[tuple[str, str]] | dict[str, Any]:
+    """Check a flow's shape, returning its steps as tuples or an error dict."""
+    if not isinstance(steps, (list, tuple)):
+        return _invalid_steps("Flow must be a list of steps")
+
+    validated = []
+    for number, step in enumerate(steps, start=1):
+        if (
+            not isinstance(step, (list, tuple))
+            or len(step) != 2
+            or not all(isinstance(part, str) for part in step)
+        ):
+            return _invalid_steps(f"Step {number} is not an [action, argument] pair: {step!r}")
+        if step[0] not in FLOW_ACTIONS:
+            return _invalid_steps(f"Unknown flow action: {step[0]}")
+        validated.append((step[0], step[1]))
+    return validated
+
+
+async def run_flow_async(
+    steps: list[tuple[str, str]],
+    timeout: int = 10,
+    headless: bool = False,
+) -> dict[str, Any]:
+    """Run a flow in a fresh Chromium.
+
+    Args:
+        steps: (action, argument) pairs; actions are goto, wait, click and
+            screenshot.
+        timeout: Timeout in seconds for each wait.
+        headless: Run Chromium without a window.
+
+    Returns:
+        Success dict with the final url/title and screenshots taken, or an
+        error dict for a malformed flow or naming the failing step.
+    """
+    validated = _validate_steps(steps)
+    if isinstance(validated, dict):
+        return validated
+
+    from playwright.async_api import async_playwright
+
+    screenshots: list[dict[str, Any]] = []
+    index = 0
+    try:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=headless, args=list(DEFAULT_LAUNCH_ARGS))
+            try:
+                page = await (await browser.new_context(no_viewport=True)).new_page()
+
+                for action, group in groupby(validated, key=lambda step: step[0]):
+                    items = list(group)
+                    if action in _CONCURRENT_ACTIONS:
+                        results = await asyncio.gather(
+                            *(_run_step(page, action, arg, timeout) for _, arg in items)
+                        )
+                    else:
+                        results = [await _run_step(page, action, arg, timeout) for _, arg in items]
+                    screenshots.extend(r for r in results if r)
+                    index += len(items)
+
+                return success_response(
+                    "browser_flow",
+                    {
+                        "steps": len(validated),
+                        "url": page.url,
+                        "title": await page.title(),
+                        "screenshots": screenshots,
+                    },
+                )
+            finally:
+                await browser.close()
+    except Exception as e:
+        return error_response(
+            "flow_failed",
+            f"Flow failed at step {index + 1}: {str(e)}",
+            recoverable=True,
+        )
+
+
+def run_flow(
+    steps: list[tuple[str, str]],
+    timeout: int = 10,
+    headless: bool = False,
+) -> dict[str, Any]:
+    """Synchronous wrapper around run_flow_async.
+
+    Must not be called from a running event loop (await run_flow_async there).
+    """
+    return asyncio.run(run_flow_async(steps, timeout=timeout, headless=headless))
@@ -1,12 +1,13 @@
 """Keyboard control using pyautogui."""
 
 import time
+from functools import lru_cache
 from typing import Any
 
 import pyautogui
 
 from programmatic_demo.utils.output import error_response, success_response
-from programmatic_demo.utils.timing import typing_delay
+from programmatic_demo.utils.timing import typing_delays
 
 # Key name mapping for pyautogui
 KEY_MAPPING = {
@@ -51,6 +52,23 @@ MODIFIER_MAPPING = {
     "shift": "shift",
 }
 
+# Both tables fused for lookups; the originals stay for error suggestions
+_ALL_KEYS = {**KEY_MAPPING, **MODIFIER_MAPPING}
+
+
+@lru_cache(maxsize=256)
+def _parse_hotkey(keys_str: str) -> tuple[str, ...]:
+    """Parse a key combination like 'cmd+shift+p' into pyautogui key names.
+
+    Args:
+        keys_str: Key combination string.
+
+    Returns:
+        Tuple of pyautogui key names.
+    """
+    parts = (k.strip().lower() for k in keys_str.split("+"))
+    return tuple(_ALL_KEYS.get(part, part) for part in parts)
+
 
 class Keyboard:
     """Keyboard controller with human-like typing."""
@@ -60,12 +78,13 @@ class Keyboard:
         # Disable pyautogui failsafe for automated use
         pyautogui.FAILSAFE = False
 
-    def type_text(self, text: str, delay_ms: int = 50) -> dict[str, Any]:
+    def type_text(self, text: str, delay_ms: int = 50, jitter: bool = True) -> dict[str, Any]:
         """Type text with human-like delays.
 
         Args:
             text: Text to type.
             delay_ms: Base delay between keystrokes in ms.
+            jitter: Vary each delay by ±30%; if False, type at a fixed interval.
 
         Returns:
             Success dict with text and duration.
@@ -73,9 +92,12 @@ class Keyboard:
         try:
             start_time = time.time()
 
-            for char in text:
-                pyautogui.press(char) if len(char) == 1 else pyautogui.write(char)
-                time.sleep(typing_delay(delay_ms))
+            if jitter:
+                for char, delay in zip(text, typing_delays(delay_ms, len(text))):
+                    pyautogui.press(char)
+                    time.sleep(delay)
+            else:
+                pyautogui.write(text, interval=delay_ms / 1000.0)
 
             duration = time.time() - start_time
 
@@ -102,7 +124,7 @@ class Keyboard:
         key_lower = key.lower()
 
         # Map to pyautogui key name
-        pyautogui_key = KEY_MAPPING.get(key_lower, key_lower)
+        pyautogui_key = _ALL_KEYS.get(key_lower, key_lower)
 
         try:
             pyautogui.press(pyautogui_key)
@@ -125,21 +147,13 @@ class Keyboard:
             Success dict.
         """
         try:
-            # Parse keys from string like "cmd+shift+p"
-            parts = [k.strip().lower() for k in keys_str.split("+")]
-
-            # Map to pyautogui key names
-            mapped_keys = []
-            for part in parts:
-                if part in MODIFIER_MAPPING:
-                    mapped_keys.append(MODIFIER_MAPPING[part])
-                elif part in KEY_MAPPING:
-                    mapped_keys.append(KEY_MAPPING[part])
-                else:
-                    mapped_keys.append(part)
+            # Parsed once per distinct string; repeated shortcuts hit the cache
+            mapped_keys = _parse_hotkey(keys_str)
 
             pyautogui.hotkey(*mapped_keys)
-            return success_response("keyboard_hotkey", {"keys": keys_str, "parsed": mapped_keys})
+            return success_response(
+                "keyboard_hotkey", {"keys": keys_str, "parsed": list(mapped_keys)}
+            )
         except Exception as e:
             return error_response(
                 "hotkey_failed",
@@ -1,29 +1,70 @@
 """Mouse control using pyautogui with bezier curve smoothing."""
 
-import random
 import time
 from typing import Any
 
+import numpy as np
 import pyautogui
 
 from programmatic_demo.utils.output import error_response, success_response
 from programmatic_demo.utils.timing import hover_pause
 
+# On macOS, pointer moves along a path are posted as Quartz events directly,
+# skipping pyautogui's per-call wrapper (pyobjc ships with pyautogui there)
+try:
+    from Quartz import (
+        CGEventCreateMouseEvent,
+        CGEventPost,
+        kCGEventLeftMouseDragged,
+        kCGEventMouseMoved,
+        kCGHIDEventTap,
+        kCGMouseButtonLeft,
+    )
+
+    HAS_QUARTZ = True
+except ImportError:
+    HAS_QUARTZ = False
+
+
+# Random source for curve shape and jitter
+_RNG = np.random.default_rng()
 
-def _bezier_point(t: float, p0: tuple, p1: tuple, p2: tuple, p3: tuple) -> tuple:
-    """Calculate a point on a cubic bezier curve.
+
+def _post_move(x: int, y: int, dragging: bool = False) -> None:
+    """Move the pointer to (x, y) without pyautogui's pause.
 
     Args:
-        t: Parameter from 0 to 1.
-        p0, p1, p2, p3: Control points.
+        x: Target X coordinate.
+        y: Target Y coordinate.
+        dragging: Whether the left button is held (posts drag events).
+    """
+    if HAS_QUARTZ:
+        event_type = kCGEventLeftMouseDragged if dragging else kCGEventMouseMoved
+        event = CGEventCreateMouseEvent(None, event_type, (x, y), kCGMouseButtonLeft)
+        CGEventPost(kCGHIDEventTap, event)
+    else:
+        pyautogui.moveTo(x, y, _pause=False)
 
-    Returns:
-        (x, y) point on the curve.
+
+def _follow_path(path: list[tuple], duration: float, dragging: bool = False) -> None:
+    """Move the pointer through path, spreading the points over duration.
+
+    Args:
+        path: (x, y) points to visit in order.
+        duration: Total movement time in seconds.
+        dragging: Whether the left button is held.
     """
-    u = 1 - t
-    x = u**3 * p0[0] + 3 * u**2 * t * p1[0] + 3 * u * t**2 * p2[0] + t**3 * p3[0]
-    y = u**3 * p0[1] + 3 * u**2 * t * p1[1] + 3 * u * t**2 * p2[1] + t**3 * p3[1]
-    return (x, y)
+    delay = duration / len(path)
+    # Sleep to absolute deadlines so sleep overshoot and slow event posts
+    # don't add up over the path
+    # Hot callables bound to locals once rather than looked up per point
+    post, now, sleep = _post_move, time.monotonic, time.sleep
+    start = now()
+    for i, (x, y) in enumerate(path, 1):
+        post(x, y, dragging)
+        slack = start + i * delay - now()
+        if slack > 0:
+            sleep(slack)
 
 
 def _generate_bezier_path(
@@ -37,7 +78,7 @@ def _generate_bezier_path(
         num_points: Number of points to generate.
 
     Returns:
-        List of (x, y) points along the curve.
+        List of (x, y) points along the curve, ending exactly at end.
     """
     # Calculate midpoint and curve offset
     mid_x = (start[0] + end[0]) / 2
@@ -48,8 +89,7 @@ def _generate_bezier_path(
     dy = end[1] - start[1]
 
     # Control points offset perpendicular to the line
-    offset1 = random.uniform(-0.3, 0.3)
-    offset2 = random.uniform(-0.3, 0.3)
+    offset1, offset2 = _RNG.uniform(-0.3, 0.3, 2)
 
     # Control point 1 (1/3 of the way)
     cp1 = (
@@ -63,17 +103,24 @@ def _generate_bezier_path(
         start[1] + dy * 0.67 - dx * offset2,
     )
 
-    # Generate points along the curve
-    points = []
-    for i in range(num_points + 1):
-        t = i / num_points
-        point = _bezier_point(t, start, cp1, cp2, end)
-        # Add small random jitter
-        jitter_x = random.uniform(-1, 1)
-        jitter_y = random.uniform(-1, 1)
-        points.append((int(point[0] + jitter_x), int(point[1] + jitter_y)))
+    # Evaluate the cubic bezier at every t at once
+    t = np.linspace(0.0, 1.0, num_points + 1)
+    u = 1.0 - t
+    b0 = u * u * u
+    b1 = 3 * u * u * t
+    b2 = 3 * u * t * t
+    b3 = t * t * t
+    xs = b0 * start[0] + b1 * cp1[0] + b2 * cp2[0] + b3 * end[0]
+    ys = b0 * start[1] + b1 * cp1[1] + b2 * cp2[1] + b3 * end[1]
+
+    # Add small random jitter, drawn for both axes at once. The last point
+    # gets none, so the path ends exactly on the target.
+    jitter = _RNG.uniform(-1, 1, (2, num_points + 1))
+    jitter[:, -1] = 0
+    xs += jitter[0]
+    ys += jitter[1]
 
-    return points
+    return list(zip(xs.astype(np.int32).tolist(), ys.astype(np.int32).tolist()))
 
 
 class Mouse:
@@ -104,16 +151,8 @@ class Mouse:
             num_points = max(10, int(duration * 100))
             path = _generate_bezier_path(start, end, num_points)
 
-            # Calculate delay between points
-            delay = duration / len(path)
-
             # Move through path
-            for point in path:
-                pyautogui.moveTo(point[0], point[1], _pause=False)
-                time.sleep(delay)
-
-            # Ensure we end at the exact target
-            pyautogui.moveTo(x, y, _pause=False)
+            _follow_path(path, duration)
 
             return success_response(
                 "mouse_move",
@@ -173,12 +212,13 @@ class Mouse:
         # Then click
         return self.click(button=button)
 
-    def scroll(self, direction: str, amount: int) -> dict[str, Any]:
+    def scroll(self, direction: str, amount: int, chunks: int = 5) -> dict[str, Any]:
         """Scroll in direction.
 
         Args:
             direction: Scroll direction ('up', 'down', 'left', 'right').
             amount: Scroll amount.
+            chunks: Number of scroll events the amount is split across.
 
         Returns:
             Success dict.
@@ -211,9 +251,13 @@ class Mouse:
                     suggestion="Valid directions: up, down, left, right",
                 )
 
-            # Scroll in small increments for smooth animation
-            for _ in range(abs(amount)):
-                pyautogui.scroll(1 if delta > 0 else -1)
+            # Scroll in a few even chunks for smooth animation, however large
+            # the amount
+            chunks = min(abs(delta), chunks)
+            sign = 1 if delta > 0 else -1
+            for i in range(chunks):
+                step = abs(delta) * (i + 1) // chunks - abs(delta) * i // chunks
+                pyautogui.scroll(sign * step)
                 time.sleep(0.05)
 
             return success_response(
@@ -264,13 +308,7 @@ class Mouse:
             path = _generate_bezier_path(start, end, num_points)
 
             # Move through path while holding
-            delay = duration / len(path)
-            for point in path:
-                pyautogui.moveTo(point[0], point[1], _pause=False)
-                time.sleep(delay)
-
-            # Ensure we end at the exact target
-            pyautogui.moveTo(to_x, to_y, _pause=False)
+            _follow_path(path, duration, dragging=True)
 
             # Release
             pyautogui.mouseUp()
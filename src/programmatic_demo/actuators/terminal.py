@@ -1,14 +1,103 @@
 """Terminal control using tmux."""
 
+import asyncio
+import os
+import queue
 import re
 import subprocess
+import threading
 import time
+import uuid
+from functools import cache
 from typing import Any
 
 from programmatic_demo.utils.output import error_response, success_response
-
-# Regex to strip ANSI escape codes
-ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+from programmatic_demo.utils.process import executable_path, run_captured
+
+# Regex to strip ANSI escape codes. CSI sequences (colors, cursor moves) are
+# tried first as by far the most common; their byte classes don't overlap, so
+# the possessive quantifiers never need to backtrack.
+ANSI_ESCAPE = re.compile(r"\x1B(?:\[[0-?]*+[ -/]*+[@-~]|[@-Z\\-_])")
+
+# Common shell prompt endings ($, %, >, #, zsh arrows), stripped so one
+# str.endswith call checks them all
+PROMPT_SUFFIXES = tuple(p.strip() for p in ("$ ", "% ", "> ", "# ", "➜", "❯"))
+
+# tmux errors meaning the session (or the whole server) is gone; "error
+# connecting to" is what a client gets once the server has removed its socket,
+# and "server exited unexpectedly" if it connects while the server shuts down
+SESSION_GONE_ERRORS = (
+    "no server running",
+    "error connecting to",
+    "server exited unexpectedly",
+    "can't find session",
+    "can't find pane",
+    "session not found",
+)
+
+# Session environment variable naming the channel the shell signals on each
+# prompt, so a reused session can be recognised as hooked
+PROMPT_CHANNEL_VAR = "PDEMO_PROMPT_CHANNEL"
+
+# Session environment variable the shell sets to its prompt count on each
+# prompt. A wait-for signal only wakes exec(); the count says whether a new
+# prompt was shown, since tmux signals can be left over (a prompt nobody
+# waited for) or absorbed (by a waiter that timed out).
+PROMPT_COUNT_VAR = "PDEMO_PROMPT_COUNT"
+
+# Longest single wait on the prompt channel before exec() rechecks the count
+PROMPT_WAIT_SLICE = 0.5
+
+# How long to wait for tmux to answer a control-mode command before dropping
+# the connection and running the command as a one-off tmux process
+CTL_REPLY_TIMEOUT = 5
+
+# How long launch() waits for a new shell's first prompt to signal, for shells
+# with a slow startup file. It gives up sooner when the pane shows a prompt
+# that didn't signal (e.g. the user's bashrc replaced PROMPT_COMMAND), checking
+# every PROMPT_HOOK_POLL seconds.
+PROMPT_HOOK_TIMEOUT = 10
+PROMPT_HOOK_POLL = 0.25
+
+
+@cache
+def _tmux_version() -> tuple[int, int] | None:
+    """The installed tmux's (major, minor) version, or None if unknown."""
+    try:
+        _, stdout, _ = run_captured("tmux", "-V")
+    except OSError:
+        return None
+    match = re.search(r"(\d+)\.(\d+)", stdout)
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def _tmux_has_session_env() -> bool:
+    """Whether new-session takes -e environment variables (tmux 3.0+)."""
+    version = _tmux_version()
+    return version is not None and version >= (3, 0)
+
+
+def _tmux_has_control_flags() -> bool:
+    """Whether control clients can attach with no-output,ignore-size (tmux 3.2+)."""
+    version = _tmux_version()
+    return version is not None and version >= (3, 2)
+
+
+def _quote_tmux(arg: str) -> str:
+    """Quote an argument for a tmux command line, with no expansion inside."""
+    return "'" + arg.replace("'", "'\\''") + "'"
+
+
+def _pump_lines(stream: Any, lines: queue.Queue[str | None]) -> None:
+    """Copy a control client's output into a queue, then None at EOF."""
+    try:
+        for line in iter(stream.readline, ""):
+            lines.put(line)
+    except (OSError, ValueError):
+        pass
+    finally:
+        lines.put(None)
+        stream.close()
 
 
 class Terminal:
@@ -17,23 +106,184 @@ class Terminal:
     def __init__(self) -> None:
         """Initialize the terminal controller."""
         self._session_name: str | None = None
+        # Set once launch() has confirmed the session; cleared when tmux
+        # reports it gone, so the public methods don't probe it on every call
+        self._session_verified = False
+        # Control-mode client (tmux -C) attached to the session, started on
+        # first use so per-action commands don't fork a tmux client each time
+        self._ctl: subprocess.Popen[str] | None = None
+        # Its output lines, fed by a reader thread so replies can time out
+        self._ctl_lines: queue.Queue[str | None] = queue.Queue()
+        # wait-for channel the session's shell signals at every prompt, or
+        # None when exec() has to poll for the prompt instead
+        self._prompt_channel: str | None = None
 
     def _run_tmux(self, *args: str) -> tuple[int, str, str]:
         """Run a tmux command and return (returncode, stdout, stderr)."""
-        cmd = ["tmux"] + list(args)
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result.returncode, result.stdout, result.stderr
+        return self._checked(*run_captured("tmux", *args))
+
+    async def _run_tmux_async(self, *args: str) -> tuple[int, str, str]:
+        """Run a tmux command without blocking the event loop.
+
+        Returns:
+            (returncode, stdout, stderr), as _run_tmux.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            "tmux", *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await proc.communicate()
+        returncode = await proc.wait()
+        return self._checked(returncode, stdout.decode(), stderr.decode())
+
+    def _run_ctl(self, *args: str) -> tuple[int, str, str]:
+        """Run a tmux command over the session's control-mode connection.
+
+        Falls back to _run_tmux when control mode isn't available, for
+        arguments that can't go on one command line, and when the connection
+        has dropped or doesn't answer within CTL_REPLY_TIMEOUT (which also
+        gets the real error from tmux).
+
+        Returns:
+            (returncode, stdout, stderr), as _run_tmux.
+        """
+        ctl = self._control()
+        if ctl is None or any("\n" in a or "\r" in a for a in args):
+            return self._run_tmux(*args)
+
+        try:
+            stdin = ctl.stdin
+            assert stdin is not None  # opened with stdin=PIPE
+            stdin.write(" ".join(_quote_tmux(a) for a in args) + "\n")
+            stdin.flush()
+            code, lines = self._read_ctl_block(self._ctl_lines, CTL_REPLY_TIMEOUT)
+        except (OSError, ValueError):
+            code, lines = None, []
+        if code is None:
+            self._close_control()
+            return self._run_tmux(*args)
+
+        output = "".join(lines)
+        if code == 0:
+            return self._checked(0, output, "")
+        return self._checked(1, "", output)
+
+    @staticmethod
+    def _read_ctl_block(
+        source: queue.Queue[str | None], timeout: float
+    ) -> tuple[int | None, list[str]]:
+        """Read the reply to one control-mode command.
+
+        Notifications and blocks for commands this client didn't send (such
+        as the attach itself) are skipped.
+
+        Args:
+            source: The control client's output lines, None marking EOF.
+            timeout: Seconds to wait for the whole reply.
+
+        Returns:
+            (0 for %end or 1 for %error, the block's lines), or (None, [])
+            if the client exited or the timeout passed first.
+        """
+        deadline = time.monotonic() + timeout
+        lines: list[str] = []
+        guard = None
+        while True:
+            try:
+                line = source.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                return None, []
+            if line is None:
+                return None, []
+            if guard is None:
+                # "%begin <time> <number> <flags>"; flags 1 marks our commands
+                fields = line.split()
+                if len(fields) == 4 and fields[0] == "%begin" and fields[3] == "1":
+                    guard = fields[1:3]
+                continue
+            if line.startswith(("%end ", "%error ")) and line.split()[1:3] == guard:
+                return (0 if line.startswith("%end") else 1), lines
+            lines.append(line)
+
+    def _control(self) -> subprocess.Popen[str] | None:
+        """Get the control-mode client, attaching it if needed."""
+        if self._ctl is not None and self._ctl.poll() is None:
+            return self._ctl
+        self._close_control()
+        if not self._session_name or not _tmux_has_control_flags():
+            return None
+        # no-output: don't stream pane output; ignore-size: don't resize the window
+        cmd = ["tmux", "-C", "attach-session", "-f", "no-output,ignore-size"]
+        try:
+            self._ctl = subprocess.Popen(
+                cmd + ["-t", self._session_name],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except OSError:
+            return None
+        self._ctl_lines = queue.Queue()
+        threading.Thread(
+            target=_pump_lines, args=(self._ctl.stdout, self._ctl_lines), daemon=True
+        ).start()
+        return self._ctl
+
+    def _close_control(self) -> None:
+        """Detach the control-mode client, if any."""
+        ctl, self._ctl = self._ctl, None
+        if ctl is None:
+            return
+        try:
+            if ctl.stdin is not None:
+                ctl.stdin.close()
+        except OSError:
+            pass
+        try:
+            ctl.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            ctl.kill()
+            ctl.wait()
+        # The reader thread closes stdout once it sees EOF
+
+    def close(self) -> None:
+        """Release the control-mode connection. The tmux session keeps running."""
+        self._close_control()
+
+    def _checked(self, code: int, stdout: str, stderr: str) -> tuple[int, str, str]:
+        """Pass a tmux result through, noting when it says the session is gone."""
+        if code != 0 and any(e in stderr for e in SESSION_GONE_ERRORS):
+            self._invalidate()
+        return code, stdout, stderr
+
+    def _invalidate(self) -> None:
+        """Forget that the session was verified."""
+        self._session_verified = False
+        self._close_control()
 
     def _session_exists(self) -> bool:
-        """Check if the current session exists."""
+        """Check if the current session exists, as of launch() or the last tmux error."""
+        return self._session_verified and self._session_name is not None
+
+    def verify(self) -> bool:
+        """Probe tmux for the current session and update the cached state.
+
+        Returns:
+            True if the session exists.
+        """
         if not self._session_name:
             return False
         code, _, _ = self._run_tmux("has-session", "-t", self._session_name)
-        return code == 0
+        self._session_verified = code == 0
+        return self._session_verified
 
     def launch(self, name: str | None = None) -> dict[str, Any]:
         """Launch a new tmux session.
 
+        A new bash session gets a PROMPT_COMMAND hook that exec() waits on.
+        Other shells, such as zsh (the macOS default), get no hook, so exec()
+        polls the pane for them.
+
         Args:
             name: Session name. If None, generates one with timestamp.
 
@@ -43,16 +293,31 @@ class Terminal:
         # Generate session name if not provided
         if name is None:
             name = f"pdemo-{int(time.time())}"
+        if name != self._session_name:
+            self._close_control()
 
         # Check if session already exists
         code, _, _ = self._run_tmux("has-session", "-t", name)
         if code == 0:
             # Session exists, just use it
             self._session_name = name
+            self._session_verified = True
+            self._prompt_channel = self._session_prompt_channel(name)
             return success_response("terminal_launch", {"session_name": name, "reused": True})
 
-        # Create new detached session
-        code, stdout, stderr = self._run_tmux("new-session", "-d", "-s", name)
+        # Create new detached session, with a bash prompt hook when possible
+        channel = None
+        hook_args: list[str] = []
+        if _tmux_has_session_env() and self._default_shell() == "bash":
+            channel = f"pdemo-prompt-{uuid.uuid4().hex[:8]}"
+            hook_args = [
+                "-e",
+                f"{PROMPT_CHANNEL_VAR}={channel}",
+                "-e",
+                f"PROMPT_COMMAND=tmux set-environment {PROMPT_COUNT_VAR} "
+                f"$((++__pdemo_prompts)) \\; wait-for -S {channel}",
+            ]
+        code, stdout, stderr = self._run_tmux("new-session", "-d", "-s", name, *hook_args)
         if code != 0:
             return error_response(
                 "tmux_failed",
@@ -71,8 +336,77 @@ class Terminal:
             )
 
         self._session_name = name
+        self._session_verified = True
+        # The first prompt both proves the hook works and means the shell is
+        # ready for input
+        if channel is not None and self._first_prompt_signals(channel):
+            self._prompt_channel = channel
+        else:
+            self._prompt_channel = None
         return success_response("terminal_launch", {"session_name": name, "reused": False})
 
+    def _default_shell(self) -> str:
+        """Name of the shell tmux starts in new panes (e.g. "bash")."""
+        code, stdout, _ = self._run_tmux("show-options", "-gv", "default-shell")
+        shell = stdout.strip() if code == 0 else os.environ.get("SHELL", "")
+        return os.path.basename(shell)
+
+    def _session_prompt_channel(self, name: str) -> str | None:
+        """The prompt channel a session was launched with, if any."""
+        code, stdout, _ = self._run_tmux("show-environment", "-t", name, PROMPT_CHANNEL_VAR)
+        if code != 0 or "=" not in stdout:
+            return None
+        return stdout.strip().split("=", 1)[1] or None
+
+    def _first_prompt_signals(self, channel: str) -> bool:
+        """Wait for a new shell's first prompt to signal channel.
+
+        Returns:
+            True once it signals; False at PROMPT_HOOK_TIMEOUT, or once the
+            pane shows a prompt that didn't signal.
+        """
+        deadline = time.monotonic() + PROMPT_HOOK_TIMEOUT
+        prompt_shown = False
+        while time.monotonic() < deadline:
+            self._wait_signal(channel, PROMPT_HOOK_POLL)
+            if self._prompt_count() > 0:
+                return True
+            # PROMPT_COMMAND runs before the prompt is drawn, so after one more
+            # wait the hook is known not to be firing
+            if prompt_shown:
+                return False
+            result = self.read()
+            prompt_shown = result["success"] and result["result"]["output"].rstrip().endswith(
+                PROMPT_SUFFIXES
+            )
+        return False
+
+    def _prompt_count(self) -> int:
+        """How many prompts the session's hooked shell has shown."""
+        code, stdout, _ = self._run_ctl(
+            "show-environment", "-t", self._session_name, PROMPT_COUNT_VAR
+        )
+        value = stdout.strip().partition("=")[2]
+        return int(value) if code == 0 and value.isdigit() else 0
+
+    @staticmethod
+    def _wait_signal(channel: str, timeout: float) -> bool:
+        """Block until channel is signalled; False if the timeout passes first.
+
+        Spawned like run_captured (absolute path, inherited descriptors) so
+        the frequent wait slices don't fork the whole process.
+        """
+        try:
+            subprocess.run(
+                [executable_path("tmux"), "wait-for", channel],
+                capture_output=True,
+                timeout=timeout,
+                close_fds=False,
+            )
+        except subprocess.TimeoutExpired:
+            return False
+        return True
+
     def send(self, text: str) -> dict[str, Any]:
         """Send text to the terminal without pressing Enter.
 
@@ -91,7 +425,7 @@ class Terminal:
             )
 
         # Escape special characters for tmux send-keys
-        code, _, stderr = self._run_tmux("send-keys", "-t", self._session_name, text)
+        code, _, stderr = self._run_ctl("send-keys", "-t", self._session_name, text)
         if code != 0:
             return error_response("send_failed", f"Failed to send keys: {stderr}", recoverable=True)
 
@@ -100,6 +434,18 @@ class Terminal:
     def exec(self, command: str, timeout: int = 120) -> dict[str, Any]:
         """Execute a command and wait for completion.
 
+        Sessions launched with a bash shell count their prompts and signal a
+        tmux wait-for channel from PROMPT_COMMAND, so completion is the next
+        prompt rather than something polled for. Nothing but the command is
+        typed into the pane.
+        Other shells, including zsh (macOS's default), and bash sessions whose
+        startup files replace PROMPT_COMMAND, fall back to polling the pane for
+        a prompt.
+
+        A prompt that was already shown is ignored, but the shell must be idle
+        when exec() starts: the prompt after a command still running (a line
+        typed with send(), or an earlier exec() that timed out) ends this call.
+
         Args:
             command: Command to execute.
             timeout: Timeout in seconds.
@@ -115,17 +461,48 @@ class Terminal:
                 suggestion="Launch a terminal first with 'pdemo terminal launch'",
             )
 
-        # Send command with Enter key
-        code, _, stderr = self._run_tmux(
-            "send-keys", "-t", self._session_name, command, "Enter"
+        channel = self._prompt_channel
+        if channel is None:
+            return self._exec_polling(command, timeout)
+
+        prompts = self._prompt_count()
+        code, _, stderr = self._run_ctl("send-keys", "-t", self._session_name, command, "Enter")
+        if code != 0:
+            return error_response("exec_failed", f"Failed to execute: {stderr}", recoverable=True)
+
+        # Each signal (or slice) is only a cue to recheck the prompt count
+        deadline = time.monotonic() + timeout
+        while self._prompt_count() == prompts:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return error_response(
+                    "timeout",
+                    f"Command timed out after {timeout}s",
+                    recoverable=True,
+                    suggestion="Increase timeout or check if command is stuck",
+                )
+            self._wait_signal(channel, min(remaining, PROMPT_WAIT_SLICE))
+
+        read_result = self.read(lines=50)
+        if not read_result.get("success"):
+            return read_result
+        return success_response(
+            "terminal_exec", {"command": command, "output": read_result["result"]["output"]}
         )
+
+    def _exec_polling(self, command: str, timeout: int) -> dict[str, Any]:
+        """Execute a command, polling the pane for the prompt to come back.
+
+        Fallback for sessions without the prompt hook.
+        """
+        # Send command with Enter key
+        code, _, stderr = self._run_ctl("send-keys", "-t", self._session_name, command, "Enter")
         if code != 0:
             return error_response("exec_failed", f"Failed to execute: {stderr}", recoverable=True)
 
         # Wait for shell prompt to return (basic detection)
         # This polls for common prompt patterns like $, %, >, #, or zsh arrow
         start_time = time.time()
-        prompt_patterns = ["$ ", "% ", "> ", "# ", "➜", "❯"]
         last_output = ""
 
         while time.time() - start_time < timeout:
@@ -137,9 +514,7 @@ class Terminal:
             current_output = read_result.get("result", {}).get("output", "")
 
             # Check if output has stabilized and ends with a prompt
-            if current_output == last_output and any(
-                current_output.rstrip().endswith(p.strip()) for p in prompt_patterns
-            ):
+            if current_output == last_output and current_output.rstrip().endswith(PROMPT_SUFFIXES):
                 return success_response("terminal_exec", {"command": command, "output": current_output})
 
             last_output = current_output
@@ -169,23 +544,66 @@ class Terminal:
             )
 
         # Capture pane contents
-        code, stdout, stderr = self._run_tmux("capture-pane", "-t", self._session_name, "-p")
+        code, stdout, stderr = self._run_ctl("capture-pane", "-t", self._session_name, "-p")
+        return self._read_response(code, stdout, stderr, lines)
+
+    async def read_async(self, lines: int = 50) -> dict[str, Any]:
+        """Read terminal output without blocking the event loop.
+
+        Args:
+            lines: Number of lines to read.
+
+        Returns:
+            Success dict with output text.
+        """
+        if not self._session_exists():
+            return error_response(
+                "no_session",
+                "No terminal session active",
+                recoverable=True,
+                suggestion="Launch a terminal first with 'pdemo terminal launch'",
+            )
+
+        code, stdout, stderr = await self._run_tmux_async(
+            "capture-pane", "-t", self._session_name, "-p"
+        )
+        return self._read_response(code, stdout, stderr, lines)
+
+    def _read_response(self, code: int, stdout: str, stderr: str, lines: int) -> dict[str, Any]:
+        """Build the read response from a capture-pane result."""
         if code != 0:
             return error_response("read_failed", f"Failed to read: {stderr}", recoverable=True)
 
-        # Strip ANSI escape codes
-        output = ANSI_ESCAPE.sub("", stdout)
+        # Strip ANSI escape codes. capture-pane is run without -e, so there
+        # usually aren't any, and a scan for ESC is far cheaper than the regex
+        output = ANSI_ESCAPE.sub("", stdout) if "\x1b" in stdout else stdout
 
-        # Get last N lines
-        output_lines = output.splitlines()
-        if len(output_lines) > lines:
-            output = "\n".join(output_lines[-lines:])
+        # Get last N lines, splitting only the tail off rather than every line
+        body = output[:-1] if output.endswith("\n") else output
+        total_lines = body.count("\n") + 1 if output else 0
+        if total_lines > lines:
+            output = "\n".join(body.rsplit("\n", lines)[1:])
 
-        return success_response("terminal_read", {"output": output, "lines": len(output_lines)})
+        return success_response("terminal_read", {"output": output, "lines": total_lines})
 
     def wait_for(self, text: str, timeout: int = 30) -> dict[str, Any]:
         """Wait for text to appear in terminal.
 
+        Synchronous wrapper around wait_for_async; don't call it from a running
+        event loop.
+
+        Args:
+            text: Text to wait for.
+            timeout: Timeout in seconds.
+
+        Returns:
+            Success dict when found, or error dict on timeout.
+        """
+        return asyncio.run(self.wait_for_async(text, timeout=timeout))
+
+    async def wait_for_async(self, text: str, timeout: int = 30) -> dict[str, Any]:
+        """Wait for text to appear in terminal, polling without blocking the loop.
+
         Args:
             text: Text to wait for.
             timeout: Timeout in seconds.
@@ -204,15 +622,18 @@ class Terminal:
         start_time = time.time()
 
         while time.time() - start_time < timeout:
-            read_result = self.read(lines=100)
+            # The poll interval runs alongside the capture rather than after it
+            interval = asyncio.ensure_future(asyncio.sleep(0.5))
+            read_result = await self.read_async(lines=100)
             if read_result.get("success"):
                 output = read_result.get("result", {}).get("output", "")
                 if text in output:
+                    interval.cancel()
                     return success_response(
                         "terminal_wait_for",
                         {"text": text, "found": True, "elapsed": round(time.time() - start_time, 2)},
                     )
-            time.sleep(0.5)
+            await interval
 
         return error_response(
             "timeout",
@@ -236,7 +657,7 @@ class Terminal:
             )
 
         # Send Ctrl+L to clear screen
-        code, _, stderr = self._run_tmux("send-keys", "-t", self._session_name, "C-l")
+        code, _, stderr = self._run_ctl("send-keys", "-t", self._session_name, "C-l")
         if code != 0:
             return error_response("clear_failed", f"Failed to clear: {stderr}", recoverable=True)
 
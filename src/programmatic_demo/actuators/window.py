@@ -1,10 +1,22 @@
 """Window management using yabai."""
 
+import asyncio
 import json
-import subprocess
+import time
 from typing import Any
 
 from programmatic_demo.utils.output import error_response, success_response
+from programmatic_demo.utils.process import run_captured
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# How long focus() reuses a window query before asking yabai again
+SEARCH_INDEX_TTL = 1.0
 
 
 class Window:
@@ -12,13 +24,47 @@ class Window:
 
     def __init__(self) -> None:
         """Initialize the window controller."""
-        pass
+        # (lowercased app + NUL + title, window) pairs from the last query
+        self._search_index: list[tuple[str, dict[str, Any]]] = []
+        self._search_index_time: float | None = None
+
+    def _window_index(self, refresh: bool = False) -> list[tuple[str, dict[str, Any]]]:
+        """Get the search index, re-querying yabai once it is SEARCH_INDEX_TTL old.
+
+        Args:
+            refresh: Re-query even if the index is still fresh.
+
+        Returns:
+            List of (lowercased app + NUL + title, window) pairs.
+        """
+        now = time.monotonic()
+        if (
+            refresh
+            or self._search_index_time is None
+            or now - self._search_index_time > SEARCH_INDEX_TTL
+        ):
+            self._search_index = [
+                (f"{win['app']}\0{win['title']}".lower(), win) for win in self.get_windows()
+            ]
+            self._search_index_time = now
+        return self._search_index
 
     def _run_yabai(self, *args: str) -> tuple[int, str, str]:
         """Run a yabai command and return (returncode, stdout, stderr)."""
-        cmd = ["yabai", "-m"] + list(args)
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result.returncode, result.stdout, result.stderr
+        return run_captured("yabai", "-m", *args)
+
+    async def _run_yabai_async(self, *args: str) -> tuple[int, str, str]:
+        """Run a yabai command without blocking the event loop.
+
+        Returns:
+            (returncode, stdout, stderr), as _run_yabai.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            "yabai", "-m", *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await proc.communicate()
+        returncode = await proc.wait()
+        return returncode, stdout.decode(), stderr.decode()
 
     def get_windows(self) -> list[dict[str, Any]]:
         """Get list of all windows.
@@ -27,17 +73,33 @@ class Window:
             List of dicts with id, title, app, bounds.
         """
         try:
-            code, stdout, stderr = self._run_yabai("query", "--windows")
+            return self._parse_windows(*self._run_yabai("query", "--windows"))
+        except Exception:
+            # yabai missing or not runnable
+            return []
+
+    async def get_windows_async(self) -> list[dict[str, Any]]:
+        """Get list of all windows without blocking the event loop.
+
+        Returns:
+            List of dicts with id, title, app, bounds.
+        """
+        try:
+            return self._parse_windows(*await self._run_yabai_async("query", "--windows"))
+        except Exception:
+            # yabai missing or not runnable
+            return []
 
+    def _parse_windows(self, code: int, stdout: str, stderr: str) -> list[dict[str, Any]]:
+        """Build the window list from a 'query --windows' result."""
+        try:
             if code != 0:
                 return []
 
-            data = json.loads(stdout)
-            windows = []
+            data = orjson.loads(stdout) if HAS_ORJSON else json.loads(stdout)
 
-            for win in data:
-                frame = win.get("frame", {})
-                windows.append({
+            return [
+                {
                     "id": win.get("id"),
                     "title": win.get("title", ""),
                     "app": win.get("app", ""),
@@ -47,13 +109,13 @@ class Window:
                         "width": frame.get("w", 0),
                         "height": frame.get("h", 0),
                     },
-                })
-
-            return windows
+                }
+                for win in data
+                for frame in (win.get("frame", {}),)
+            ]
 
-        except FileNotFoundError:
-            return []
-        except json.JSONDecodeError:
+        except ValueError:
+            # Malformed JSON (json and orjson decode errors are both ValueErrors)
             return []
         except Exception:
             return []
@@ -67,9 +129,18 @@ class Window:
         Returns:
             Success dict with window info, or error dict.
         """
-        windows = self.get_windows()
+        # Search for matching window (case-insensitive)
+        search_lower = app_or_title.lower()
+        queried_at = self._search_index_time
+        index = self._window_index()
+        matching_window = next((win for key, win in index if search_lower in key), None)
+
+        if matching_window is None and self._search_index_time == queried_at:
+            # The index may predate the window; look again before giving up
+            index = self._window_index(refresh=True)
+            matching_window = next((win for key, win in index if search_lower in key), None)
 
-        if not windows:
+        if not index:
             return error_response(
                 "no_windows",
                 "No windows found or yabai not available",
@@ -77,16 +148,6 @@ class Window:
                 suggestion="Ensure yabai is installed and running",
             )
 
-        # Search for matching window (case-insensitive)
-        search_lower = app_or_title.lower()
-        matching_window = None
-
-        for win in windows:
-            if (search_lower in win["app"].lower() or
-                search_lower in win["title"].lower()):
-                matching_window = win
-                break
-
         if not matching_window:
             return error_response(
                 "window_not_found",
@@ -10,10 +10,12 @@ This package contains the agent roles that collaborate to create demos:
 from programmatic_demo.agents.claude_client import ClaudeClient
 from programmatic_demo.agents.director import (
     Director,
+    FrameHistory,
     RetryStrategy,
     ScenePlan,
     Step,
     compress_screenshot,
+    compress_screenshot_async,
     detect_success,
     observation_to_prompt,
     summarize_context,
@@ -22,10 +24,12 @@ from programmatic_demo.agents.director import (
 __all__ = [
     "ClaudeClient",
     "Director",
+    "FrameHistory",
     "RetryStrategy",
     "ScenePlan",
     "Step",
     "compress_screenshot",
+    "compress_screenshot_async",
     "detect_success",
     "observation_to_prompt",
     "summarize_context",
@@ -4,11 +4,18 @@ This module provides a wrapper around the Anthropic Claude API
 for use by the Director and other agents.
 """
 
+import logging
 from dataclasses import dataclass
 from typing import Any
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Marks the end of a prompt-cache prefix; the API caches everything up to and
+# including the block carrying it
+_CACHE_CONTROL: dict[str, str] = {"type": "ephemeral"}
+
+
+@dataclass(slots=True)
 class Message:
     """A message in a conversation.
 
@@ -21,7 +28,7 @@ class Message:
     content: str | list[dict[str, Any]]
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     """A response from the Claude API.
 
@@ -56,7 +63,11 @@ class ClaudeClient:
         """
         self._api_key = api_key
         self._model = model
-        self._conversation: list[Message] = []
+        # Conversation history as parallel role/content columns, which is
+        # what requests are built from; Message objects are made on demand
+        self._roles: list[str] = []
+        self._contents: list[str | list[dict[str, Any]]] = []
+        self._cache_read_tokens = 0
 
     @property
     def model(self) -> str:
@@ -64,9 +75,61 @@ class ClaudeClient:
         return self._model
 
     @property
-    def conversation(self) -> list[Message]:
-        """Get the current conversation history."""
-        return self._conversation
+    def conversation(self) -> tuple[Message, ...]:
+        """Get a read-only snapshot of the conversation history.
+
+        Use add_message() and clear_conversation() to change the history.
+        """
+        return tuple(Message(role=r, content=c) for r, c in zip(self._roles, self._contents))
+
+    @property
+    def cache_read_tokens(self) -> int:
+        """Input tokens served from the prompt cache by the last request."""
+        return self._cache_read_tokens
+
+    def request_params(self, system: str | None = None) -> dict[str, Any]:
+        """Build the model/system/messages parameters for the next request.
+
+        The system prompt and the conversation so far are marked as the
+        prompt-cache prefix, so each request only pays full price for the
+        turns added since the last one. Stored turns are never modified;
+        the marker goes on a copy of the last one, and the client's state is
+        left unchanged.
+
+        Args:
+            system: Optional system prompt.
+
+        Returns:
+            Keyword arguments for the Messages API.
+        """
+        messages = self.to_api_messages()
+        if messages:
+            content = messages[-1]["content"]
+            blocks: list[dict[str, Any]]
+            if isinstance(content, str):
+                blocks = [{"type": "text", "text": content}]
+            else:
+                blocks = list(content)
+            blocks[-1] = {**blocks[-1], "cache_control": _CACHE_CONTROL}
+            messages[-1] = {"role": messages[-1]["role"], "content": blocks}
+
+        params: dict[str, Any] = {"model": self._model, "messages": messages}
+        if system:
+            params["system"] = [{"type": "text", "text": system, "cache_control": _CACHE_CONTROL}]
+        return params
+
+    def to_api_messages(self) -> list[dict[str, Any]]:
+        """Get the conversation as Messages API message dicts."""
+        return [{"role": r, "content": c} for r, c in zip(self._roles, self._contents)]
+
+    def record_usage(self, usage: dict[str, int] | None) -> None:
+        """Note the prompt-cache hit from a response's usage information.
+
+        Args:
+            usage: The response's usage dict.
+        """
+        self._cache_read_tokens = (usage or {}).get("cache_read_input_tokens", 0)
+        logger.debug("Prompt cache read %d input tokens", self._cache_read_tokens)
 
     def send_message(
         self,
@@ -106,13 +169,18 @@ class ClaudeClient:
 
     def clear_conversation(self) -> None:
         """Clear the conversation history."""
-        self._conversation.clear()
+        self._roles.clear()
+        self._contents.clear()
 
-    def add_message(self, role: str, content: str) -> None:
+    def add_message(self, role: str, content: str | list[dict[str, Any]]) -> None:
         """Add a message to the conversation history.
 
+        The history is append-only: earlier turns form the cached prompt
+        prefix, so they shouldn't be edited once sent.
+
         Args:
             role: Message role (user or assistant).
-            content: Message content.
+            content: Message content (text or list of content blocks).
         """
-        self._conversation.append(Message(role=role, content=content))
+        self._roles.append(role)
+        self._contents.append(content)
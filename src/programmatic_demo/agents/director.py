@@ -7,59 +7,306 @@ The Director is responsible for:
 - Coordinating with other agents (Observer, Editor)
 """
 
+import asyncio
 import base64
+import hashlib
 import io
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from PIL import Image
 
+# OpenCV's SIMD area resampling is much cheaper than Pillow's LANCZOS for
+# screenshot-sized downscales
+try:
+    import cv2
+    import numpy as np
 
-def compress_screenshot(
-    image_data: bytes | str,
-    max_size: int = 1568,
-    quality: int = 85,
-) -> str:
-    """Compress a screenshot for efficient API transmission.
+    HAS_CV2 = True
+except ImportError:
+    HAS_CV2 = False
 
-    Args:
-        image_data: Raw image bytes or base64-encoded string.
-        max_size: Maximum dimension on the longest side (default 1568px).
-        quality: JPEG quality percentage (default 85%).
+try:
+    import pybase64
 
-    Returns:
-        Base64-encoded compressed JPEG image.
+    HAS_PYBASE64 = True
+except ImportError:
+    HAS_PYBASE64 = False
+
+try:
+    import blake3
+
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+# Recently compressed screenshots, keyed on (content digest, max_size, quality,
+# mode), where mode is always "static" or "motion" ("auto" is resolved to one
+# of them first). Each entry keeps the frame's signature when it was encoded
+# in "auto" mode, so a hit still updates the caller's FrameHistory. The
+# Director often re-observes an unchanged frame between actions.
+SCREENSHOT_CACHE_SIZE = 32
+_screenshot_cache: dict[tuple[bytes, int, int, str], tuple[str, bytes | None]] = {}
+
+# JPEG quality for frames of a static scene, where the detail lost is not
+# worth the extra bytes (motion frames keep the caller's quality)
+STATIC_QUALITY = 55
+
+# Worker processes for compress_screenshot_async
+ENCODE_WORKERS = 2
+_encode_pool: ProcessPoolExecutor | None = None
+
+
+@dataclass
+class FrameHistory:
+    """The last frame compressed in "auto" mode, held by the caller.
+
+    Attributes:
+        last_digest: Content digest of the last frame's image bytes.
+        last_signature: Coarse pixel signature of the last frame.
     """
-    # Handle base64 input
+
+    last_digest: bytes | None = None
+    last_signature: bytes | None = None
+
+
+def _content_digest(data: bytes) -> bytes:
+    """Hash image bytes for the screenshot cache."""
+    if HAS_BLAKE3:
+        return blake3.blake3(data).digest()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _decode_image_input(image_data: bytes | str) -> bytes:
+    """Decode base64 input to raw image bytes; bytes pass through."""
     if isinstance(image_data, str):
-        image_data = base64.b64decode(image_data)
+        if HAS_PYBASE64:
+            return pybase64.b64decode(image_data, validate=False)
+        return base64.b64decode(image_data)
+    return image_data
+
+
+def _cache_result(
+    key: tuple[bytes, int, int, str], result: str, signature: bytes | None
+) -> str:
+    """Store a compressed screenshot, evicting the oldest entry once full."""
+    # Dicts keep insertion order, so the first key is the oldest
+    if len(_screenshot_cache) >= SCREENSHOT_CACHE_SIZE:
+        del _screenshot_cache[next(iter(_screenshot_cache))]
+    _screenshot_cache[key] = (result, signature)
+    return result
+
+
+def _frame_signature(img: Image.Image) -> bytes:
+    """Reduce a frame to a coarse 16x16 grayscale signature.
 
+    Frames that differ only by noise or a blinking caret share a signature.
+    """
+    thumb = img.resize((16, 16), Image.Resampling.BOX).convert("L")
+    return bytes(value >> 4 for value in thumb.tobytes())
+
+
+def _compress_image(
+    image_data: bytes,
+    max_size: int,
+    quality: int,
+    mode: str = "motion",
+    last_signature: bytes | None = None,
+) -> tuple[str, str, bytes | None]:
+    """Resize and JPEG-encode raw image bytes.
+
+    Returns:
+        (base64 JPEG, the mode used ("auto" resolved to "static" or
+        "motion"), the frame's signature in "auto" mode, else None).
+    """
     # Open image
     img = Image.open(io.BytesIO(image_data))
 
+    # Work out the target size before decoding anything
+    width, height = img.size
+    target = None
+    if width > max_size or height > max_size:
+        if width > height:
+            target = (max_size, int(height * (max_size / width)))
+        else:
+            target = (int(width * (max_size / height)), max_size)
+        # JPEGs can decode straight at 1/2, 1/4 or 1/8 scale; draft picks the
+        # smallest of those still at least the target size
+        if img.format == "JPEG":
+            img.draft("RGB", target)
+
     # Convert to RGB if necessary (for PNG with alpha, etc.)
     if img.mode in ("RGBA", "P"):
         img = img.convert("RGB")
 
     # Resize if larger than max_size
-    width, height = img.size
-    if width > max_size or height > max_size:
-        if width > height:
-            new_width = max_size
-            new_height = int(height * (max_size / width))
+    if target is not None and img.size != target:
+        if HAS_CV2 and img.mode in ("RGB", "L"):
+            img = Image.fromarray(cv2.resize(np.asarray(img), target, interpolation=cv2.INTER_AREA))
         else:
-            new_height = max_size
-            new_width = int(width * (max_size / height))
-        img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            img = img.resize(target, Image.Resampling.LANCZOS)
+
+    # An unchanged scene in "auto" mode counts as static
+    signature = None
+    if mode == "auto":
+        signature = _frame_signature(img)
+        mode = "static" if signature == last_signature else "motion"
+    if mode == "static":
+        quality = min(quality, STATIC_QUALITY)
 
     # Compress to JPEG
     buffer = io.BytesIO()
     img.save(buffer, format="JPEG", quality=quality, optimize=True)
-    buffer.seek(0)
 
     # Return as base64
-    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+    if HAS_PYBASE64:
+        return pybase64.b64encode_as_string(buffer.getvalue()), mode, signature
+    return base64.b64encode(buffer.getvalue()).decode("utf-8"), mode, signature
+
+
+def _resolve_mode(
+    digest: bytes, max_size: int, quality: int, mode: str, history: FrameHistory | None
+) -> tuple[str, bytes | None]:
+    """Resolve "auto" without decoding the frame, where possible.
+
+    A byte-identical repeat of the last frame is static, and a frame cached
+    with its signature is compared on that. Other "auto" frames stay "auto"
+    and are resolved from their pixels.
+
+    Returns:
+        (the mode, the frame's signature if it was found in the cache).
+    """
+    if mode != "auto":
+        return mode, None
+    if history is None:
+        raise ValueError('mode="auto" needs a FrameHistory to compare frames against')
+    if digest == history.last_digest:
+        return "static", None
+    for used in ("motion", "static"):
+        cached = _screenshot_cache.get((digest, max_size, quality, used))
+        if cached is not None and cached[1] is not None:
+            signature = cached[1]
+            return ("static" if signature == history.last_signature else "motion"), signature
+    return "auto", None
+
+
+def _note_frame(history: FrameHistory, digest: bytes, signature: bytes | None) -> None:
+    """Record an "auto" frame in the caller's history."""
+    history.last_digest = digest
+    if signature is not None:
+        history.last_signature = signature
+
+
+def compress_screenshot(
+    image_data: bytes | str,
+    max_size: int = 1568,
+    quality: int = 85,
+    mode: Literal["static", "motion", "auto"] = "motion",
+    history: FrameHistory | None = None,
+) -> str:
+    """Compress a screenshot for efficient API transmission.
+
+    Args:
+        image_data: Raw image bytes or base64-encoded string.
+        max_size: Maximum dimension on the longest side (default 1568px).
+        quality: JPEG quality percentage (default 85%).
+        mode: "motion" encodes at quality. "static" caps it at STATIC_QUALITY,
+            for a scene that isn't changing (e.g. waiting on a prompt).
+            "auto" treats a frame as static when it looks the same as the
+            previous frame in history.
+        history: The caller's FrameHistory; required for "auto" mode, and
+            updated by it.
+
+    Returns:
+        Base64-encoded compressed JPEG image. Identical input is served from
+        a small cache of recent results.
+
+    Raises:
+        ValueError: If mode is "auto" and no history is given.
+    """
+    image_data = _decode_image_input(image_data)
+    digest = _content_digest(image_data)
+    resolved, known_signature = _resolve_mode(digest, max_size, quality, mode, history)
+
+    cached = _screenshot_cache.get((digest, max_size, quality, resolved))
+    if cached is not None:
+        result, signature = cached
+        if mode == "auto" and history is not None:
+            _note_frame(history, digest, signature or known_signature)
+        return result
+
+    last_signature = history.last_signature if history is not None else None
+    result, used, signature = _compress_image(
+        image_data, max_size, quality, resolved, last_signature
+    )
+    signature = signature or known_signature
+    if mode == "auto" and history is not None:
+        _note_frame(history, digest, signature)
+    return _cache_result((digest, max_size, quality, used), result, signature)
+
+
+def _get_encode_pool() -> ProcessPoolExecutor:
+    """Get the screenshot encoding pool, starting it on first use."""
+    global _encode_pool
+    if _encode_pool is None:
+        _encode_pool = ProcessPoolExecutor(max_workers=ENCODE_WORKERS)
+    return _encode_pool
+
+
+async def compress_screenshot_async(
+    image_data: bytes | str,
+    max_size: int = 1568,
+    quality: int = 85,
+    mode: Literal["static", "motion", "auto"] = "motion",
+    history: FrameHistory | None = None,
+) -> str:
+    """Compress a screenshot in a worker process, without blocking the event loop.
+
+    Same arguments and result as compress_screenshot, sharing its cache. The
+    resize and encode run in a small process pool, so they overlap with other
+    awaits instead of holding the GIL.
+
+    Args:
+        image_data: Raw image bytes or base64-encoded string.
+        max_size: Maximum dimension on the longest side (default 1568px).
+        quality: JPEG quality percentage (default 85%).
+        mode: "static", "motion" or "auto", as for compress_screenshot.
+        history: The caller's FrameHistory, as for compress_screenshot.
+
+    Returns:
+        Base64-encoded compressed JPEG image.
+
+    Raises:
+        ValueError: If mode is "auto" and no history is given.
+    """
+    image_data = _decode_image_input(image_data)
+    digest = _content_digest(image_data)
+    resolved, known_signature = _resolve_mode(digest, max_size, quality, mode, history)
+
+    cached = _screenshot_cache.get((digest, max_size, quality, resolved))
+    if cached is not None:
+        result, signature = cached
+        if mode == "auto" and history is not None:
+            _note_frame(history, digest, signature or known_signature)
+        return result
+
+    # Only the encoded bytes cross the process boundary, never a PIL image
+    last_signature = history.last_signature if history is not None else None
+    result, used, signature = await asyncio.get_running_loop().run_in_executor(
+        _get_encode_pool(),
+        _compress_image,
+        image_data,
+        max_size,
+        quality,
+        resolved,
+        last_signature,
+    )
+    signature = signature or known_signature
+    if mode == "auto" and history is not None:
+        _note_frame(history, digest, signature)
+    return _cache_result((digest, max_size, quality, used), result, signature)
 
 
 def summarize_context(
@@ -127,8 +374,8 @@ def observation_to_prompt(observation: dict[str, Any]) -> str:
         parts.append(f"**Timestamp:** {ts_str}")
 
     # Window information
-    if "window" in observation and observation["window"]:
-        window = observation["window"]
+    window = observation.get("window")
+    if window:
         window_info = []
         if "title" in window:
             window_info.append(f"Title: {window['title']}")
@@ -141,26 +388,29 @@ def observation_to_prompt(observation: dict[str, Any]) -> str:
             parts.append("**Active Window:**\n" + "\n".join(f"  - {info}" for info in window_info))
 
     # OCR text
-    if "ocr_text" in observation and observation["ocr_text"]:
-        ocr_text = observation["ocr_text"].strip()
+    ocr_text = observation.get("ocr_text")
+    if ocr_text:
+        ocr_text = ocr_text.strip()
         if ocr_text:
             parts.append(f"**OCR Text:**\n```\n{ocr_text}\n```")
 
     # Terminal output
-    if "terminal_output" in observation and observation["terminal_output"]:
-        terminal = observation["terminal_output"].strip()
+    terminal = observation.get("terminal_output")
+    if terminal:
+        terminal = terminal.strip()
         if terminal:
             parts.append(f"**Terminal Output:**\n```\n{terminal}\n```")
 
     # Screenshot indicator (we don't include base64, just note it exists)
-    if "screenshot_base64" in observation and observation["screenshot_base64"]:
+    if observation.get("screenshot_base64"):
         parts.append("**Screenshot:** [Image attached]")
-    elif "screenshot_path" in observation and observation["screenshot_path"]:
-        parts.append(f"**Screenshot:** {observation['screenshot_path']}")
+    elif screenshot_path := observation.get("screenshot_path"):
+        parts.append(f"**Screenshot:** {screenshot_path}")
 
     # Any additional context
-    if "context" in observation and observation["context"]:
-        parts.append(f"**Additional Context:**\n{observation['context']}")
+    context = observation.get("context")
+    if context:
+        parts.append(f"**Additional Context:**\n{context}")
 
     if not parts:
         return "No observation data available."
@@ -237,7 +487,7 @@ def detect_success(
     return True
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     """A single step in a demo scene.
 
@@ -285,7 +535,7 @@ class RetryStrategy:
     reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenePlan:
     """A plan for executing a demo scene.
 
@@ -6,6 +6,8 @@ from typing import Optional
 import typer
 
 from programmatic_demo.actuators.browser import get_browser
+from programmatic_demo.actuators.browser_flow import run_flow
+from programmatic_demo.utils.output import error_response
 
 app = typer.Typer(help="Browser automation commands.")
 
@@ -13,10 +15,16 @@ app = typer.Typer(help="Browser automation commands.")
 @app.command("launch")
 def launch(
     url: Optional[str] = typer.Option(None, "--url", "-u", help="URL to navigate to after launch"),
+    force: bool = typer.Option(False, "--force", help="Restart the browser instead of reusing it"),
+    persistent: bool = typer.Option(
+        False,
+        "--persistent/--no-persistent",
+        help="Keep the browser profile in ~/.pdemo between runs",
+    ),
 ) -> None:
     """Launch browser."""
     browser = get_browser()
-    result = browser.launch(url=url)
+    result = browser.launch(url=url, force=force, persistent=persistent)
     typer.echo(json.dumps(result, indent=2))
 
 
@@ -80,6 +88,30 @@ def screenshot(
     typer.echo(json.dumps(result, indent=2))
 
 
+@app.command("flow")
+def flow(
+    steps: str = typer.Option(
+        ...,
+        "--steps",
+        help='JSON list of [action, arg] steps, e.g. [["goto", "https://example.com"]]',
+    ),
+    timeout: int = typer.Option(10, "--timeout", "-t", help="Timeout in seconds for each wait"),
+) -> None:
+    """Run a goto/wait/click/screenshot flow in a fresh browser."""
+    try:
+        parsed = json.loads(steps)
+    except json.JSONDecodeError as e:
+        result = error_response(
+            "invalid_steps",
+            f"--steps is not valid JSON: {e}",
+            recoverable=True,
+            suggestion='Pass a JSON list such as [["goto", "https://example.com"]]',
+        )
+    else:
+        result = run_flow(parsed, timeout=timeout)
+    typer.echo(json.dumps(result, indent=2))
+
+
 @app.command("close")
 def close() -> None:
     """Close browser."""
@@ -13,10 +13,13 @@ app = typer.Typer(help="Keyboard control commands.")
 def type_text(
     text: str = typer.Option(..., "--text", "-t", help="Text to type"),
     delay_ms: int = typer.Option(50, "--delay-ms", "-d", help="Delay between keystrokes in ms"),
+    jitter: bool = typer.Option(
+        True, "--jitter/--no-jitter", help="Vary delays like a human typist"
+    ),
 ) -> None:
     """Type text with human-like delays."""
     keyboard = get_keyboard()
-    result = keyboard.type_text(text, delay_ms=delay_ms)
+    result = keyboard.type_text(text, delay_ms=delay_ms, jitter=jitter)
     typer.echo(json.dumps(result, indent=2))
 
 
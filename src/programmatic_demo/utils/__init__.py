@@ -1,12 +1,16 @@
 """Utility modules for ProgrammaticDemo."""
 
 from programmatic_demo.utils.output import error_response, success_response
-from programmatic_demo.utils.timing import hover_pause, random_delay, typing_delay
+from programmatic_demo.utils.process import executable_path, run_captured
+from programmatic_demo.utils.timing import hover_pause, random_delay, typing_delay, typing_delays
 
 __all__ = [
     "success_response",
     "error_response",
     "random_delay",
     "typing_delay",
+    "typing_delays",
     "hover_pause",
+    "executable_path",
+    "run_captured",
 ]
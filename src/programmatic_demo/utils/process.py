@@ -0,0 +1,41 @@
+"""Subprocess helpers for the CLI tools the actuators drive (tmux, yabai)."""
+
+import shutil
+import subprocess
+from functools import cache
+
+
+@cache
+def executable_path(name: str) -> str:
+    """Resolve a program on PATH to its absolute path.
+
+    Args:
+        name: Program name, e.g. "tmux".
+
+    Returns:
+        The absolute path, or name unchanged if it isn't on PATH.
+    """
+    return shutil.which(name) or name
+
+
+def run_captured(*argv: str) -> tuple[int, str, str]:
+    """Run a program and capture its output.
+
+    The program is started by absolute path without force-closing file
+    descriptors, which lets subprocess use posix_spawn rather than fork+exec
+    (fork copies the page tables of a large parent, and is slow on macOS).
+    Python's own descriptors are non-inheritable, so none leak to the child.
+
+    Args:
+        argv: Program name followed by its arguments.
+
+    Returns:
+        (returncode, stdout, stderr).
+
+    Raises:
+        FileNotFoundError: If the program isn't installed.
+    """
+    result = subprocess.run(
+        [executable_path(argv[0]), *argv[1:]], capture_output=True, text=True, close_fds=False
+    )
+    return result.returncode, result.stdout, result.stderr
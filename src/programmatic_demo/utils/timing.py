@@ -31,6 +31,23 @@ def typing_delay(base_ms: int = 50) -> float:
     return delay_ms / 1000.0
 
 
+def typing_delays(base_ms: int, count: int) -> list[float]:
+    """Get jittered delays for a run of keystrokes in one go.
+
+    Same ±30% jitter as typing_delay, for a whole string of keystrokes.
+
+    Args:
+        base_ms: Base delay in milliseconds.
+        count: Number of keystrokes.
+
+    Returns:
+        Delays in seconds (for use with time.sleep).
+    """
+    base_s = base_ms / 1000.0
+    uniform = random.uniform
+    return [base_s * (1 + uniform(-0.3, 0.3)) for _ in range(count)]
+
+
 def hover_pause() -> float:
     """Get a random pause duration for hovering before clicking.
 
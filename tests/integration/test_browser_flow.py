@@ -0,0 +1,103 @@
+"""Test browser flow validation.
+
+This test verifies that:
+1. Malformed flows return an error dict instead of raising
+2. The flow CLI reports --steps that aren't valid JSON
+3. Screenshot paths resolve against the current directory, even after a chdir
+"""
+
+import json
+
+import pytest
+
+
+@pytest.fixture
+def run_flow():
+    """The flow runner, imported lazily (the actuators package needs a display)."""
+    from programmatic_demo.actuators.browser_flow import run_flow
+
+    return run_flow
+
+
+class TestFlowValidation:
+    """Test run_flow rejects malformed steps before launching a browser."""
+
+    @pytest.mark.parametrize(
+        "steps",
+        [
+            [["goto"]],
+            [["goto", "https://example.com", "extra"]],
+            [["goto", 42]],
+            ["goto"],
+            {"goto": "https://example.com"},
+        ],
+    )
+    def test_malformed_steps(self, run_flow, steps):
+        """Test steps that aren't [action, argument] pairs."""
+        result = run_flow(steps)
+
+        assert not result["success"]
+        assert result["error"]["type"] == "invalid_step"
+
+    def test_unknown_action(self, run_flow):
+        """Test an action outside goto/wait/click/screenshot."""
+        result = run_flow([["goto", "https://example.com"], ["hover", "#menu"]])
+
+        assert not result["success"]
+        assert "hover" in result["error"]["message"]
+
+
+class TestFlowCLI:
+    """Test the browser flow command."""
+
+    def test_steps_not_json(self):
+        """Test --steps that isn't JSON prints an error response."""
+        from typer.testing import CliRunner
+
+        from programmatic_demo.cli.browser import app
+
+        result = CliRunner().invoke(app, ["flow", "--steps", "not json"])
+
+        assert result.exit_code == 0
+        output = json.loads(result.output)
+        assert not output["success"]
+        assert output["error"]["type"] == "invalid_steps"
+
+    def test_steps_missing_argument(self):
+        """Test a step without an argument prints an error response."""
+        from typer.testing import CliRunner
+
+        from programmatic_demo.cli.browser import app
+
+        result = CliRunner().invoke(app, ["flow", "--steps", '[["goto"]]'])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["error"]["type"] == "invalid_step"
+
+
+class TestPrepareScreenshotPath:
+    """Test resolving screenshot output paths."""
+
+    def test_relative_path_follows_chdir(self, tmp_path, monkeypatch):
+        """Test the same relative path resolves under each working directory."""
+        from programmatic_demo.actuators.browser import prepare_screenshot_path
+
+        first, second = tmp_path / "first", tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+
+        monkeypatch.chdir(first)
+        assert prepare_screenshot_path("shots/a.png") == first.resolve() / "shots" / "a.png"
+        monkeypatch.chdir(second)
+        assert prepare_screenshot_path("shots/a.png") == second.resolve() / "shots" / "a.png"
+
+    def test_missing_directory(self, tmp_path):
+        """Test a directory that doesn't exist (or was deleted) still resolves."""
+        from programmatic_demo.actuators.browser import prepare_screenshot_path
+
+        shots = tmp_path / "shots"
+        shots.mkdir()
+        path = prepare_screenshot_path(str(shots / "a.png"))
+        shots.rmdir()
+
+        assert prepare_screenshot_path(str(shots / "b.png")) == path.parent / "b.png"
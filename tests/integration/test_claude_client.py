@@ -0,0 +1,129 @@
+"""Test ClaudeClient request building.
+
+This test verifies that:
+1. request_params marks the system prompt and last turn for prompt caching
+2. Building a request leaves the stored conversation unchanged
+3. record_usage keeps the prompt-cache hit from a response
+4. The conversation property is a read-only snapshot
+"""
+
+import pytest
+
+from programmatic_demo.agents.claude_client import ClaudeClient, Message
+
+
+class TestRequestParams:
+    """Test ClaudeClient.request_params."""
+
+    def test_empty_conversation(self):
+        """Test a request with no turns has no messages or system prompt."""
+        client = ClaudeClient(model="test-model")
+
+        assert client.request_params() == {"model": "test-model", "messages": []}
+
+    def test_system_prompt_cached(self):
+        """Test the system prompt is a cache-marked text block."""
+        client = ClaudeClient()
+
+        params = client.request_params(system="You direct demos.")
+
+        assert params["system"] == [
+            {"type": "text", "text": "You direct demos.", "cache_control": {"type": "ephemeral"}}
+        ]
+
+    def test_last_turn_cached(self):
+        """Test only the last turn carries the cache marker."""
+        client = ClaudeClient()
+        client.add_message("user", "first")
+        client.add_message("assistant", "reply")
+        client.add_message("user", "second")
+
+        messages = client.request_params()["messages"]
+
+        assert messages[0] == {"role": "user", "content": "first"}
+        assert messages[1] == {"role": "assistant", "content": "reply"}
+        assert messages[2] == {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "second", "cache_control": {"type": "ephemeral"}}
+            ],
+        }
+
+    def test_block_content_cached(self):
+        """Test a last turn made of blocks gets the marker on its final block."""
+        client = ClaudeClient()
+        blocks = [
+            {"type": "image", "source": {"type": "base64", "data": "..."}},
+            {"type": "text", "text": "What changed?"},
+        ]
+        client.add_message("user", blocks)
+
+        content = client.request_params()["messages"][0]["content"]
+
+        assert content[0] == blocks[0]
+        assert content[1] == {**blocks[1], "cache_control": {"type": "ephemeral"}}
+
+    def test_conversation_unchanged(self):
+        """Test building a request doesn't modify the stored turns."""
+        client = ClaudeClient()
+        blocks = [{"type": "text", "text": "hello"}]
+        client.add_message("user", blocks)
+
+        first = client.request_params()
+        second = client.request_params()
+
+        assert first == second
+        assert blocks == [{"type": "text", "text": "hello"}]
+        assert client.to_api_messages() == [{"role": "user", "content": blocks}]
+
+
+class TestRecordUsage:
+    """Test ClaudeClient.record_usage."""
+
+    def test_cache_read_tokens(self):
+        """Test the cache hit is kept from the usage dict."""
+        client = ClaudeClient()
+
+        client.record_usage({"input_tokens": 12, "cache_read_input_tokens": 3400})
+
+        assert client.cache_read_tokens == 3400
+
+    def test_missing_usage(self):
+        """Test usage without cache information counts as no hit."""
+        client = ClaudeClient()
+        client.record_usage({"cache_read_input_tokens": 10})
+
+        client.record_usage(None)
+
+        assert client.cache_read_tokens == 0
+
+
+class TestConversation:
+    """Test ClaudeClient.conversation."""
+
+    def test_snapshot(self):
+        """Test the history is returned as Message objects in order."""
+        client = ClaudeClient()
+        client.add_message("user", "hi")
+        client.add_message("assistant", "hello")
+
+        assert client.conversation == (
+            Message(role="user", content="hi"),
+            Message(role="assistant", content="hello"),
+        )
+
+    def test_read_only(self):
+        """Test appending to the snapshot fails instead of being silently lost."""
+        client = ClaudeClient()
+
+        with pytest.raises(AttributeError):
+            client.conversation.append(Message(role="user", content="lost"))
+
+    def test_clear(self):
+        """Test clear_conversation empties the history."""
+        client = ClaudeClient()
+        client.add_message("user", "hi")
+
+        client.clear_conversation()
+
+        assert client.conversation == ()
@@ -9,19 +9,25 @@ This test verifies that:
 6. Context summarization and observation handling work
 """
 
+import asyncio
 import base64
 import io
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 from PIL import Image
 
 from programmatic_demo.agents.director import (
+    SCREENSHOT_CACHE_SIZE,
     Director,
+    FrameHistory,
     RetryStrategy,
     ScenePlan,
     Step,
+    _screenshot_cache,
     compress_screenshot,
+    compress_screenshot_async,
     detect_success,
     observation_to_prompt,
     summarize_context,
@@ -659,6 +665,95 @@ class TestCompressScreenshot:
         # Should succeed without error
         assert isinstance(result, str)
 
+    def test_compress_caches_identical_input(self):
+        """Test repeated input is served from the cache."""
+        image_data = self.create_test_image(width=150, height=150)
+
+        first = compress_screenshot(image_data)
+        with patch("programmatic_demo.agents.director.Image.open") as mock_open:
+            second = compress_screenshot(base64.b64encode(image_data).decode("utf-8"))
+
+        assert second == first
+        mock_open.assert_not_called()
+
+    def test_compress_cache_keys_on_options(self):
+        """Test a different max_size is not served the cached result."""
+        image_data = self.create_test_image(width=160, height=160)
+
+        compress_screenshot(image_data)
+        result = compress_screenshot(image_data, max_size=80)
+
+        img = Image.open(io.BytesIO(base64.b64decode(result)))
+        assert img.size == (80, 80)
+
+    def test_compress_cache_is_bounded(self):
+        """Test the cache evicts its oldest entries."""
+        for size in range(10, 10 + SCREENSHOT_CACHE_SIZE + 5):
+            compress_screenshot(self.create_test_image(width=size, height=size))
+
+        assert len(_screenshot_cache) == SCREENSHOT_CACHE_SIZE
+
+    def test_compress_static_mode_is_smaller(self):
+        """Test static mode encodes at a lower quality."""
+        img = Image.effect_noise((400, 300), 64).convert("RGB")
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG")
+
+        motion = compress_screenshot(buffer.getvalue(), mode="motion")
+        static = compress_screenshot(buffer.getvalue(), mode="static")
+
+        assert len(static) < len(motion)
+
+    def test_compress_auto_mode_detects_unchanged_scene(self):
+        """Test auto mode drops quality when the same frame is sent again."""
+        img = Image.effect_noise((400, 300), 64).convert("RGB")
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG")
+        history = FrameHistory()
+
+        changed = compress_screenshot(buffer.getvalue(), mode="auto", history=history)
+        unchanged = compress_screenshot(buffer.getvalue(), mode="auto", history=history)
+
+        assert len(unchanged) < len(changed)
+        assert unchanged == compress_screenshot(buffer.getvalue(), mode="static")
+
+    def test_compress_auto_mode_tracks_cache_hits(self):
+        """Test a frame served from the cache still updates the history."""
+
+        def png(img):
+            buffer = io.BytesIO()
+            img.save(buffer, format="PNG")
+            return buffer.getvalue()
+
+        frame_a = png(Image.effect_noise((400, 300), 64).convert("RGB"))
+        frame_b = png(Image.new("RGB", (400, 300), color="blue"))
+        history = FrameHistory()
+        _screenshot_cache.clear()
+
+        compress_screenshot(frame_a, mode="auto", history=history)
+        compress_screenshot(frame_b, mode="auto", history=history)
+        # A changed scene again, served from the cache on its stored signature
+        with patch("programmatic_demo.agents.director._compress_image") as encode:
+            compress_screenshot(frame_a, mode="auto", history=history)
+            result = compress_screenshot(frame_b, mode="auto", history=history)
+
+        encode.assert_not_called()
+        assert result == compress_screenshot(frame_b, mode="motion")
+
+    def test_compress_auto_mode_requires_history(self):
+        """Test auto mode without a FrameHistory is rejected."""
+        with pytest.raises(ValueError):
+            compress_screenshot(self.create_test_image(), mode="auto")
+
+    def test_compress_async_matches_sync(self):
+        """Test the process-pool variant returns the same JPEG."""
+        image_data = self.create_test_image(width=2400, height=1200)
+
+        result = asyncio.run(compress_screenshot_async(image_data, max_size=600))
+
+        _screenshot_cache.clear()
+        assert result == compress_screenshot(image_data, max_size=600)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,294 @@
+"""Test the tmux-backed Terminal actuator.
+
+This test verifies that:
+1. exec() waits for completion without typing anything besides the command
+2. Commands ending in & or a comment still complete
+3. Control-mode commands are quoted, time out, and fall back to one-off tmux runs
+4. The verified-session state is cached and dropped when tmux reports it gone
+"""
+
+import queue
+import shutil
+import subprocess
+import time
+
+import pytest
+
+requires_tmux = pytest.mark.skipif(
+    shutil.which("tmux") is None or shutil.which("bash") is None,
+    reason="tmux and bash are required",
+)
+
+
+@pytest.fixture
+def terminal(tmp_path, monkeypatch):
+    """A Terminal on a private tmux server running bash with an empty HOME."""
+    monkeypatch.setenv("TMUX_TMPDIR", str(tmp_path))
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("SHELL", shutil.which("bash"))
+    monkeypatch.delenv("TMUX", raising=False)
+    from programmatic_demo.actuators.terminal import Terminal
+
+    term = Terminal()
+    result = term.launch("pdemo-test")
+    assert result["success"]
+    yield term
+
+    term.close()
+    subprocess.run(["tmux", "kill-server"], capture_output=True)
+
+
+@pytest.fixture
+def replaced_hook_terminal(tmp_path, monkeypatch):
+    """A Terminal whose login bash replaces PROMPT_COMMAND, as prompt frameworks do."""
+    monkeypatch.setenv("TMUX_TMPDIR", str(tmp_path))
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("SHELL", shutil.which("bash"))
+    monkeypatch.delenv("TMUX", raising=False)
+    (tmp_path / ".bash_profile").write_text("PROMPT_COMMAND=true\n")
+    from programmatic_demo.actuators.terminal import Terminal
+
+    term = Terminal()
+    yield term
+
+    term.close()
+    subprocess.run(["tmux", "kill-server"], capture_output=True)
+
+
+@requires_tmux
+class TestTerminalExec:
+    """Test Terminal.exec completion detection."""
+
+    def test_exec_uses_prompt_hook(self, terminal):
+        """Test a bash session gets the prompt hook."""
+        assert terminal._prompt_channel is not None
+
+    def test_exec_types_only_the_command(self, terminal):
+        """Test nothing is appended to the command in the pane."""
+        result = terminal.exec("echo hello", timeout=10)
+
+        assert result["success"]
+        output = result["result"]["output"]
+        assert "hello" in output
+        assert "wait-for" not in output
+
+    def test_exec_background_command(self, terminal):
+        """Test a command ending in & completes."""
+        result = terminal.exec("sleep 1 &", timeout=5)
+
+        assert result["success"]
+
+    def test_exec_trailing_comment(self, terminal):
+        """Test a command ending in a comment completes."""
+        result = terminal.exec("echo hi # note", timeout=5)
+
+        assert result["success"]
+        assert "hi" in result["result"]["output"]
+
+    def test_exec_ignores_earlier_prompts(self, terminal):
+        """Test a prompt shown before exec() doesn't end it early."""
+        terminal.send("echo sent-$((1 + 1))\n")
+        assert terminal.wait_for("sent-2", timeout=5)["success"]
+        time.sleep(0.2)
+
+        result = terminal.exec("sleep 1; echo finished", timeout=5)
+
+        assert result["success"]
+        assert "finished" in result["result"]["output"]
+
+    def test_exec_after_unwaited_prompts(self, terminal):
+        """Test prompts nobody waited for neither end nor stall the next exec."""
+        for marker in ("first", "second"):
+            terminal.send(f"echo {marker}-$((1 + 1))\n")
+            assert terminal.wait_for(f"{marker}-2", timeout=5)["success"]
+        time.sleep(0.2)
+
+        start = time.monotonic()
+        result = terminal.exec("sleep 0.5; echo done", timeout=5)
+
+        assert result["success"]
+        assert "done" in result["result"]["output"]
+        assert 0.5 <= time.monotonic() - start < 2
+
+    def test_replaced_hook_falls_back_quickly(self, replaced_hook_terminal):
+        """Test a shell that overwrites PROMPT_COMMAND doesn't stall launch."""
+        start = time.monotonic()
+        result = replaced_hook_terminal.launch("pdemo-test")
+
+        assert result["success"]
+        assert time.monotonic() - start < 5
+        assert replaced_hook_terminal._prompt_channel is None
+        assert "polled" in replaced_hook_terminal.exec("echo polled", timeout=10)["result"]["output"]
+
+    def test_exec_timeout(self, terminal):
+        """Test a command that outlasts the timeout reports it."""
+        result = terminal.exec("sleep 5", timeout=1)
+
+        assert not result["success"]
+        assert result["error"]["type"] == "timeout"
+
+
+class TestQuoteTmux:
+    """Test quoting arguments for control-mode command lines."""
+
+    def test_plain(self):
+        """Test a plain argument is single-quoted."""
+        from programmatic_demo.actuators.terminal import _quote_tmux
+
+        assert _quote_tmux("echo hi") == "'echo hi'"
+
+    def test_single_quote(self):
+        """Test an embedded single quote is closed, escaped and reopened."""
+        from programmatic_demo.actuators.terminal import _quote_tmux
+
+        assert _quote_tmux("it's") == "'it'\\''s'"
+
+    def test_no_expansion(self):
+        """Test tmux specials stay inside the quotes."""
+        from programmatic_demo.actuators.terminal import _quote_tmux
+
+        assert _quote_tmux("$HOME; #{pane_id}") == "'$HOME; #{pane_id}'"
+
+
+class TestReadCtlBlock:
+    """Test reading one control-mode reply."""
+
+    @staticmethod
+    def _source(*lines):
+        source = queue.Queue()
+        for line in lines:
+            source.put(line)
+        return source
+
+    def test_reply(self):
+        """Test the lines of this client's block are returned."""
+        from programmatic_demo.actuators.terminal import Terminal
+
+        source = self._source(
+            "%begin 1 1 0\n",
+            "%end 1 1 0\n",
+            "%session-changed $1 demo\n",
+            "%begin 2 7 1\n",
+            "hello\n",
+            "%end 2 7 1\n",
+        )
+
+        assert Terminal._read_ctl_block(source, 1) == (0, ["hello\n"])
+
+    def test_error(self):
+        """Test an %error block returns code 1."""
+        from programmatic_demo.actuators.terminal import Terminal
+
+        source = self._source("%begin 2 7 1\n", "unknown command\n", "%error 2 7 1\n")
+
+        assert Terminal._read_ctl_block(source, 1) == (1, ["unknown command\n"])
+
+    def test_eof(self):
+        """Test a client that exits mid-reply returns None."""
+        from programmatic_demo.actuators.terminal import Terminal
+
+        source = self._source("%begin 2 7 1\n", None)
+
+        assert Terminal._read_ctl_block(source, 1) == (None, [])
+
+    def test_timeout(self):
+        """Test a client that stops answering returns None at the deadline."""
+        from programmatic_demo.actuators.terminal import Terminal
+
+        start = time.monotonic()
+        result = Terminal._read_ctl_block(self._source("%begin 2 7 1\n"), 0.2)
+
+        assert result == (None, [])
+        assert time.monotonic() - start < 2
+
+
+@requires_tmux
+class TestTerminalControlMode:
+    """Test the control-mode connection and its fallbacks."""
+
+    def test_read_uses_control_mode(self, terminal):
+        """Test commands go over a single control client."""
+        terminal.exec("echo over-control", timeout=5)
+        ctl = terminal._ctl
+
+        assert "over-control" in terminal.read()["result"]["output"]
+        assert ctl is not None and terminal._ctl is ctl
+
+    def test_stuck_client_falls_back(self, terminal, monkeypatch):
+        """Test a control client that never answers is dropped for a one-off run."""
+        from programmatic_demo.actuators import terminal as terminal_module
+
+        monkeypatch.setattr(terminal_module, "CTL_REPLY_TIMEOUT", 0.2)
+        terminal.exec("echo still-readable", timeout=5)
+        terminal._close_control()
+        # A client that reads commands but never replies
+        terminal._ctl = subprocess.Popen(
+            ["cat"], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, text=True
+        )
+        terminal._ctl_lines = queue.Queue()
+
+        start = time.monotonic()
+        result = terminal.read()
+
+        assert result["success"]
+        assert "still-readable" in result["result"]["output"]
+        assert time.monotonic() - start < 2
+
+    def test_multiline_argument_falls_back(self, terminal, monkeypatch):
+        """Test an argument with a newline skips the control connection."""
+        calls = []
+        run_tmux = terminal._run_tmux
+        monkeypatch.setattr(terminal, "_run_tmux", lambda *a: calls.append(a) or run_tmux(*a))
+
+        assert terminal.send("echo one\necho two")["success"]
+        assert calls and calls[0][0] == "send-keys"
+
+    def test_no_control_flags_falls_back(self, terminal, monkeypatch):
+        """Test tmux without control-mode flags runs one-off commands."""
+        from programmatic_demo.actuators import terminal as terminal_module
+
+        terminal._close_control()
+        monkeypatch.setattr(terminal_module, "_tmux_has_control_flags", lambda: False)
+
+        assert terminal.read()["success"]
+        assert terminal._ctl is None
+
+
+@requires_tmux
+class TestTerminalSessionState:
+    """Test caching of the verified session."""
+
+    def test_launch_verifies_session(self, terminal):
+        """Test launch leaves the session marked verified."""
+        assert terminal._session_verified
+
+    def test_commands_skip_has_session(self, terminal, monkeypatch):
+        """Test the public methods don't probe the session each call."""
+        calls = []
+        run_tmux = terminal._run_tmux
+        monkeypatch.setattr(terminal, "_run_tmux", lambda *a: calls.append(a) or run_tmux(*a))
+
+        terminal.read()
+        terminal.send("x")
+
+        assert not any(call[0] == "has-session" for call in calls)
+
+    def test_killed_session_is_invalidated(self, terminal):
+        """Test a session killed outside the actuator is forgotten."""
+        terminal.read()
+        subprocess.run(["tmux", "kill-session", "-t", "pdemo-test"], capture_output=True)
+
+        result = terminal.read()
+
+        assert not result["success"]
+        assert not terminal._session_verified
+        assert terminal._ctl is None
+        assert terminal.read()["error"]["type"] == "no_session"
+
+    def test_verify_refreshes_state(self, terminal):
+        """Test verify() re-probes tmux."""
+        subprocess.run(["tmux", "kill-session", "-t", "pdemo-test"], capture_output=True)
+
+        assert terminal._session_verified
+        assert not terminal.verify()
+        assert not terminal._session_verified